@@ -0,0 +1,98 @@
+import sys
+import time
+import asyncio
+import argparse
+import subprocess
+from random import uniform
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bot.utils.event_loop import install_event_loop
+
+
+BACKENDS = ('asyncio', 'uvloop')
+ACCOUNTS = (100, 1_000, 5_000)
+DURATION = 10
+
+
+async def handle_graphql(request: web.Request) -> web.Response:
+    await request.read()
+
+    return web.json_response({'data': {'telegramGameProcessTapsBatch': {'coinsAmount': 1}}})
+
+
+async def run_account(http_client: aiohttp.ClientSession, url: str, deadline: float, counter: list[int]) -> None:
+    loop = asyncio.get_running_loop()
+
+    while loop.time() < deadline:
+        await asyncio.sleep(uniform(.5, 1.5))
+
+        async with http_client.post(url=url, data=b'{"operationName":"Tap"}') as response:
+            await response.read()
+
+        counter[0] += 1
+
+
+async def run_fleet(accounts: int) -> tuple[float, int]:
+    app = web.Application()
+    app.router.add_post('/graphql', handle_graphql)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+
+    site = web.TCPSite(runner, host='127.0.0.1', port=0)
+    await site.start()
+
+    port = site._server.sockets[0].getsockname()[1]
+    url = f'http://127.0.0.1:{port}/graphql'
+    counter = [0]
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0)) as http_client:
+        started_cpu = time.process_time()
+        deadline = asyncio.get_running_loop().time() + DURATION
+
+        await asyncio.gather(*(run_account(http_client=http_client, url=url, deadline=deadline, counter=counter)
+                               for _ in range(accounts)))
+
+        cpu_time = time.process_time() - started_cpu
+
+    await runner.cleanup()
+
+    return cpu_time, counter[0]
+
+
+def run_backend(backend: str, accounts: int) -> None:
+    if install_event_loop(backend=backend) != backend:
+        print(f"{backend:>8} | {accounts:>5} accounts | not installed")
+        return
+
+    cpu_time, requests = asyncio.run(run_fleet(accounts=accounts))
+
+    print(f"{backend:>8} | {accounts:>5} accounts | {requests:>7,} requests | "
+          f"cpu {cpu_time:6.2f} s | {cpu_time / accounts * 1e3:6.2f} ms/account | "
+          f"{cpu_time / max(requests, 1) * 1e6:7.1f} us/request")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--backend', choices=BACKENDS)
+    parser.add_argument('--accounts', type=int)
+    args = parser.parse_args()
+
+    if args.backend:
+        run_backend(backend=args.backend, accounts=args.accounts)
+        return
+
+    print(f"Each account sends one request every ~1 s for {DURATION} s to a local server")
+
+    for accounts in ACCOUNTS:
+        for backend in BACKENDS:
+            subprocess.run([sys.executable, __file__, '--backend', backend, '--accounts', str(accounts)], check=True)
+
+
+if __name__ == '__main__':
+    main()
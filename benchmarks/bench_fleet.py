@@ -0,0 +1,257 @@
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+BENCHMARK_ENV = {
+    'API_ID': '1',
+    'API_HASH': 'benchmark',
+    'LOG_LEVEL': 'ERROR',
+    'SESSIONS_RAMP_UP_RATE': '1000',
+    'TG_REFRESH_CONCURRENCY': '100',
+    'TG_REFRESH_RATE': '1000',
+}
+
+for key, value in BENCHMARK_ENV.items():
+    os.environ.setdefault(key, value)
+
+from bot.config import settings
+from bot.utils.stats import stats
+from bot.utils.metrics import graphql_latency, graphql_errors
+from bot.utils.event_loop import install_event_loop
+from bot.utils.launcher import run_tasks
+from bot.core.profiler import profiler
+from stub_client import StubClient
+
+
+STAGES = (10, 100, 1_000, 10_000)
+WARMUP = 30
+DURATION = 60
+LATENCY_BUCKETS = tuple(round(.0005 * 1.25 ** index, 6) for index in range(40))
+COMPARED_FIELDS = ('accounts_per_core', 'rss_kb_per_account', 'graphql_p99_ms', 'loop_lag_p99_ms',
+                   'taps_per_second')
+
+
+def get_rss() -> int:
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+
+
+def get_quantile(values: list[float], quantile: float) -> float:
+    return values[min(int(len(values) * quantile), len(values) - 1)] if values else 0.
+
+
+def get_histogram_quantile(quantile: float) -> float:
+    counts = [sum(bucket) for bucket in zip(*(values[:-1] for values in graphql_latency.values.values()))]
+    rank = quantile * sum(counts)
+    cumulative = 0
+    lower = 0.
+
+    for upper, count in zip((*graphql_latency.buckets, float('inf')), counts):
+        if count and cumulative + count >= rank:
+            return lower if upper == float('inf') else lower + (upper - lower) * (rank - cumulative) / count
+
+        cumulative += count
+        lower = upper
+
+    return 0.
+
+
+async def run_stage(accounts: int, warmup: float, duration: float) -> dict:
+    graphql_latency.buckets = LATENCY_BUCKETS
+    rss_before = get_rss()
+
+    tg_clients = (StubClient(user_id=user_id) for user_id in range(1, accounts + 1))
+    fleet = asyncio.create_task(run_tasks(tg_clients=tg_clients, proxies=[], metrics_port=0))
+    lag_sampler = asyncio.create_task(profiler.sample_lag())
+
+    await asyncio.sleep(warmup)
+
+    graphql_latency.values.clear()
+    graphql_errors.values.clear()
+    profiler.lags.clear()
+
+    stats_before = stats.snapshot()
+    cpu_before = time.process_time()
+    started_at = time.perf_counter()
+
+    await asyncio.sleep(duration)
+
+    cpu_time = time.process_time() - cpu_before
+    elapsed = time.perf_counter() - started_at
+    stats_after = stats.snapshot()
+    rss_after = get_rss()
+
+    if fleet.done():
+        raise RuntimeError(f'Fleet stopped before the measurement ended: {fleet.exception()}')
+
+    fleet.cancel()
+    lag_sampler.cancel()
+    await asyncio.gather(fleet, lag_sampler, return_exceptions=True)
+
+    lags = sorted(profiler.lags)
+    taps = stats_after.get('taps', 0) - stats_before.get('taps', 0)
+    requests = stats_after.get('requests', 0) - stats_before.get('requests', 0)
+
+    return {
+        'accounts': accounts,
+        'active_accounts': stats_after.get('accounts', 0),
+        'duration_s': round(elapsed, 2),
+        'cpu_s': round(cpu_time, 3),
+        'cpu_ms_per_account_s': round(cpu_time / elapsed / accounts * 1000, 4),
+        'accounts_per_core': round(accounts * elapsed / cpu_time, 1) if cpu_time else None,
+        'rss_mb': round(rss_after / 2 ** 20, 1),
+        'rss_kb_per_account': round((rss_after - rss_before) / accounts / 1024, 2),
+        'requests': requests,
+        'requests_per_second': round(requests / elapsed, 1),
+        'graphql_errors': int(sum(graphql_errors.values.values())),
+        'graphql_p50_ms': round(get_histogram_quantile(quantile=.5) * 1000, 2),
+        'graphql_p99_ms': round(get_histogram_quantile(quantile=.99) * 1000, 2),
+        'loop_lag_p50_ms': round(get_quantile(lags, .5) * 1000, 2),
+        'loop_lag_p99_ms': round(get_quantile(lags, .99) * 1000, 2),
+        'loop_lag_max_ms': round(lags[-1] * 1000, 2) if lags else 0.,
+        'taps_per_second': round(taps / elapsed, 1),
+    }
+
+
+def run_child(args) -> None:
+    event_loop = install_event_loop(backend=settings.EVENT_LOOP)
+    result = asyncio.run(run_stage(accounts=args.stage, warmup=args.warmup, duration=args.duration))
+    result['event_loop'] = event_loop
+
+    with open(args.result, 'w', encoding='utf-8') as file:
+        json.dump(result, file)
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(url: str, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            urllib.request.urlopen(url, timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+
+            time.sleep(.1)
+
+
+def get_revision() -> str | None:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_stage_process(accounts: int, args, graphql_url: str) -> dict:
+    with tempfile.TemporaryDirectory(prefix='bench_fleet_') as workdir:
+        result_path = os.path.join(workdir, 'result.json')
+
+        subprocess.run([sys.executable, str(Path(__file__).resolve()), '--stage', str(accounts),
+                        '--warmup', str(args.warmup), '--duration', str(args.duration), '--result', result_path],
+                       cwd=workdir, env={**os.environ, 'GRAPHQL_URL': graphql_url}, check=True)
+
+        with open(result_path, encoding='utf-8') as file:
+            return json.load(file)
+
+
+def compare(results: list[dict], baseline_path: str) -> None:
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = {stage['accounts']: stage for stage in json.load(file)['stages']}
+
+    for result in results:
+        previous = baseline.get(result['accounts'])
+        if previous is None:
+            continue
+
+        changes = []
+        for name in COMPARED_FIELDS:
+            if previous.get(name) and result.get(name) is not None:
+                changes.append(f'{name} {(result[name] - previous[name]) / previous[name] * 100:+.1f}%')
+
+        print(f"{result['accounts']:>6,} accounts vs baseline | " + ' | '.join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the tapper fleet against a local GraphQL stand-in')
+    parser.add_argument('--stages', type=int, nargs='+', default=STAGES, help='Sessions count for each stage')
+    parser.add_argument('--warmup', type=float, default=WARMUP, help='Seconds before measuring each stage')
+    parser.add_argument('--duration', type=float, default=DURATION, help='Measured seconds of each stage')
+    parser.add_argument('--latency', type=float, default=0, help='Stand-in server response delay in seconds')
+    parser.add_argument('--jitter', type=float, default=0, help='Stand-in server delay jitter in seconds')
+    parser.add_argument('--output', default='bench_fleet.json', help='Path of the JSON results')
+    parser.add_argument('--baseline', help='Previous JSON results to compare against')
+    parser.add_argument('--stage', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.stage:
+        run_child(args)
+        return
+
+    port = get_free_port()
+    server = subprocess.Popen([sys.executable, str(ROOT / 'benchmarks' / 'mock_server.py'), '--port', str(port),
+                               '--latency', str(args.latency), '--jitter', str(args.jitter)],
+                              stdout=subprocess.DEVNULL)
+    results = []
+
+    try:
+        wait_for_server(url=f'http://127.0.0.1:{port}/faults')
+
+        for accounts in args.stages:
+            result = run_stage_process(accounts=accounts, args=args, graphql_url=f'http://127.0.0.1:{port}/graphql')
+            results.append(result)
+
+            print(f"{accounts:>6,} accounts | {result['accounts_per_core']:>9,} accounts/core | "
+                  f"rss {result['rss_kb_per_account']:>7.1f} KB/account | "
+                  f"graphql p50 {result['graphql_p50_ms']:>6.1f} ms p99 {result['graphql_p99_ms']:>7.1f} ms | "
+                  f"lag p99 {result['loop_lag_p99_ms']:>6.1f} ms | {result['taps_per_second']:>9,.1f} taps/s")
+    finally:
+        server.terminate()
+        server.wait()
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({
+            'revision': get_revision(),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'warmup_s': args.warmup,
+            'duration_s': args.duration,
+            'server_latency_s': args.latency,
+            'settings': {key: os.environ[key] for key in BENCHMARK_ENV if not key.startswith('API_')},
+            'stages': results,
+        }, file, indent=2)
+
+    print(f"Results saved to {args.output}")
+
+    if args.baseline:
+        compare(results=results, baseline_path=args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import sys
+import json
+import timeit
+import tracemalloc
+from random import randint
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bot.utils.graphql import Query, OperationName
+from bot.utils.json_codec import BACKEND, dumps, loads, encode_request
+
+
+TAPS = 75
+ROUNDS = 20_000
+
+
+def make_variables() -> dict:
+    return {
+        'payload': {
+            'nonce': 'a' * 64,
+            'tapsCount': TAPS,
+            'vector': ','.join(str(randint(1, 4)) for _ in range(TAPS)),
+        },
+    }
+
+
+def encode_baseline(variables: dict) -> bytes:
+    json_data = {
+        'operationName': OperationName.MutationGameProcessTapsBatch,
+        'query': Query.MutationGameProcessTapsBatch,
+        'variables': variables
+    }
+
+    return json.dumps(json_data).encode('utf-8')
+
+
+def encode_cached(variables: dict) -> bytes:
+    return encode_request(operation_name=OperationName.MutationGameProcessTapsBatch.value,
+                          query=Query.MutationGameProcessTapsBatch.value,
+                          variables=variables)
+
+
+def measure_allocations(func, variables: dict) -> float:
+    func(variables)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+
+    for _ in range(100):
+        func(variables)
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (peak - before)
+
+
+def main():
+    variables = make_variables()
+
+    assert json.loads(encode_baseline(variables)) == loads(encode_cached(variables))
+
+    response = dumps({'data': {'telegramGameProcessTapsBatch': {'coinsAmount': 1, 'nonce': 'a' * 64}}})
+
+    results = [
+        ('encode baseline (json.dumps dict)', encode_baseline),
+        (f'encode cached prefix ({BACKEND})', encode_cached),
+    ]
+
+    print(f"JSON backend: {BACKEND} | {TAPS} taps per batch | {ROUNDS:,} rounds")
+
+    for name, func in results:
+        seconds = timeit.timeit(lambda: func(variables), number=ROUNDS)
+        print(f"{name:<40} {seconds / ROUNDS * 1e6:8.2f} us/batch | "
+              f"body {len(func(variables)):,} B | peak alloc {measure_allocations(func, variables):,} B")
+
+    for name, func in [('decode baseline (json.loads)', json.loads), (f'decode {BACKEND}', loads)]:
+        seconds = timeit.timeit(lambda: func(response), number=ROUNDS)
+        print(f"{name:<40} {seconds / ROUNDS * 1e6:8.2f} us/response")
+
+
+if __name__ == '__main__':
+    main()
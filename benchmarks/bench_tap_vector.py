@@ -0,0 +1,35 @@
+import sys
+import timeit
+from random import randint
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bot.utils.scripts import generate_tap_vector
+
+
+ROUNDS = 2_000
+
+
+def generate_baseline(taps: int) -> str:
+    vector = []
+
+    for _ in range(taps):
+        vector.append(str(randint(1, 4)))
+
+    return ','.join(vector)
+
+
+def main():
+    for taps in (15, 75, 500, 2575):
+        assert len(generate_baseline(taps)) == len(generate_tap_vector(taps=taps, zones=4))
+
+        baseline = timeit.timeit(lambda: generate_baseline(taps), number=ROUNDS) / ROUNDS
+        bulk = timeit.timeit(lambda: generate_tap_vector(taps=taps, zones=4), number=ROUNDS) / ROUNDS
+
+        print(f"{taps:>5} taps | loop {baseline * 1e6:9.2f} us | bulk {bulk * 1e6:8.2f} us | "
+              f"x{baseline / bulk:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,434 @@
+import json
+import asyncio
+import argparse
+from time import time
+from uuid import uuid4
+from base64 import urlsafe_b64encode
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from random import random, randint, uniform
+from typing import Callable
+
+from aiohttp import web
+
+
+TOKEN_LIFETIME = 3600
+TURBO_DURATION = 10
+TURBO_MULTIPLIER = 10
+TAPBOT_DURATION = 3 * 3600
+TAPBOT_PRICE = 200_000
+FREE_BOOSTS_AMOUNT = 3
+FREE_BOOSTS_RECHARGE_INTERVAL = 24 * 3600
+SPIN_ENERGY = 10
+
+
+def get_boss_health(level: int) -> int:
+    return 1_000 * level ** 2
+
+
+def get_upgrade_price(level: int) -> int:
+    return 1_000 * 2 ** level
+
+
+def format_date(timestamp: float | None) -> str | None:
+    if timestamp is None:
+        return None
+
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+def encode_segment(data: dict) -> str:
+    return urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+
+def create_access_token(user_id: int, now: float) -> str:
+    header = encode_segment({'alg': 'HS256', 'typ': 'JWT'})
+    payload = encode_segment({'sub': user_id, 'exp': int(now) + TOKEN_LIFETIME})
+
+    return f'{header}.{payload}.{uuid4().hex}'
+
+
+class GameError(Exception):
+    pass
+
+
+@dataclass(slots=True)
+class Account:
+    user_id: int
+    first_name: str = ''
+    username: str = ''
+    clock: Callable[[], float] = time
+
+    coins: int = 0
+    coins_earned: int = 0
+    energy: float = 1_000
+    weapon_level: int = 1
+    energy_limit_level: int = 1
+    energy_recharge_level: int = 1
+    tap_bot_level: int = 0
+    nonce: str = field(default_factory=lambda: uuid4().hex)
+    updated_at: float = 0
+
+    boss_level: int = 1
+    boss_health: int = get_boss_health(1)
+
+    turbo_amount: int = FREE_BOOSTS_AMOUNT
+    refill_amount: int = FREE_BOOSTS_AMOUNT
+    turbo_ends_at: float = 0
+    boosts_recharged_at: float = 0
+    spin_energy: int = SPIN_ENERGY
+
+    tapbot_purchased: bool = False
+    tapbot_starts_at: float | None = None
+    tapbot_ends_at: float | None = None
+    tapbot_used_attempts: int = 0
+
+    request_times: list[float] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.updated_at = self.boosts_recharged_at = self.clock()
+
+    @property
+    def max_energy(self) -> int:
+        return 500 + 500 * self.energy_limit_level
+
+    def regenerate(self) -> None:
+        now = self.clock()
+        self.energy = min(self.max_energy, self.energy + self.energy_recharge_level * (now - self.updated_at))
+        self.updated_at = now
+
+    def recharge_boosts(self) -> None:
+        if self.clock() - self.boosts_recharged_at >= FREE_BOOSTS_RECHARGE_INTERVAL:
+            self.turbo_amount = self.refill_amount = FREE_BOOSTS_AMOUNT
+            self.tapbot_used_attempts = 0
+            self.boosts_recharged_at = self.clock()
+
+    def to_game_config(self) -> dict:
+        self.regenerate()
+        self.recharge_boosts()
+
+        return {
+            '_id': str(self.user_id),
+            'coinsAmount': self.coins,
+            'currentEnergy': int(self.energy),
+            'maxEnergy': self.max_energy,
+            'weaponLevel': self.weapon_level,
+            'zonesCount': 4,
+            'tapsReward': 0,
+            'energyLimitLevel': self.energy_limit_level,
+            'energyRechargeLevel': self.energy_recharge_level,
+            'tapBotLevel': self.tap_bot_level,
+            'currentBoss': {
+                '_id': str(self.boss_level),
+                'level': self.boss_level,
+                'currentHealth': self.boss_health,
+                'maxHealth': get_boss_health(self.boss_level),
+                '__typename': 'TelegramGameBossOutput',
+            },
+            'freeBoosts': {
+                '_id': str(self.user_id),
+                'currentTurboAmount': self.turbo_amount,
+                'maxTurboAmount': FREE_BOOSTS_AMOUNT,
+                'turboLastActivatedAt': None,
+                'turboAmountLastRechargeDate': None,
+                'currentRefillEnergyAmount': self.refill_amount,
+                'maxRefillEnergyAmount': FREE_BOOSTS_AMOUNT,
+                'refillEnergyLastActivatedAt': None,
+                'refillEnergyAmountLastRechargeDate': None,
+                '__typename': 'TelegramGameFreeBoostsOutput',
+            },
+            'bonusLeaderDamageEndAt': None,
+            'bonusLeaderDamageStartAt': None,
+            'bonusLeaderDamageMultiplier': 0,
+            'nonce': self.nonce,
+            'spinEnergyNextRechargeAt': None,
+            'spinEnergyNonRefillable': 0,
+            'spinEnergyRefillable': self.spin_energy,
+            'spinEnergyTotal': self.spin_energy,
+            'spinEnergyStaticLimit': SPIN_ENERGY,
+            '__typename': 'TelegramGameConfigOutput',
+        }
+
+    def to_tapbot_config(self) -> dict:
+        return {
+            'damagePerSec': self.tap_bot_level or 1,
+            'endsAt': format_date(self.tapbot_ends_at),
+            'id': str(self.user_id),
+            'isPurchased': self.tapbot_purchased,
+            'startsAt': format_date(self.tapbot_starts_at),
+            'totalAttempts': 3,
+            'usedAttempts': self.tapbot_used_attempts,
+            '__typename': 'TelegramGameTapbotOutput',
+        }
+
+    def process_taps(self, nonce: str, taps: int, vector: str) -> dict:
+        if nonce != self.nonce:
+            raise GameError('Nonce is invalid')
+
+        if taps <= 0 or len(vector.split(',')) != taps:
+            raise GameError('Taps vector is invalid')
+
+        self.regenerate()
+
+        if self.clock() < self.turbo_ends_at:
+            damage = taps * self.weapon_level * TURBO_MULTIPLIER
+        else:
+            taps = min(taps, int(self.energy // self.weapon_level))
+            damage = taps * self.weapon_level
+            self.energy -= damage
+
+        damage = min(damage, self.boss_health)
+
+        self.boss_health -= damage
+        self.coins += damage
+        self.coins_earned += damage
+        self.nonce = uuid4().hex
+
+        return self.to_game_config()
+
+    def set_next_boss(self) -> dict:
+        if self.boss_health > 0:
+            raise GameError('Boss is not defeated')
+
+        self.boss_level += 1
+        self.boss_health = get_boss_health(self.boss_level)
+
+        return self.to_game_config()
+
+    def activate_booster(self, booster_type: str) -> dict:
+        self.recharge_boosts()
+
+        if booster_type == 'Turbo' and self.turbo_amount > 0:
+            self.turbo_amount -= 1
+            self.turbo_ends_at = self.clock() + TURBO_DURATION
+        elif booster_type == 'Recharge' and self.refill_amount > 0:
+            self.refill_amount -= 1
+            self.regenerate()
+            self.energy = self.max_energy
+        else:
+            raise GameError(f'Booster {booster_type} is not available')
+
+        return self.to_game_config()
+
+    def purchase_upgrade(self, upgrade_type: str) -> dict:
+        if upgrade_type == 'TapBot':
+            if self.tapbot_purchased or self.coins < TAPBOT_PRICE:
+                raise GameError('TapBot can not be purchased')
+
+            self.coins -= TAPBOT_PRICE
+            self.tapbot_purchased = True
+            self.tap_bot_level = 1
+
+            return self.to_game_config()
+
+        attribute = {
+            'Damage': 'weapon_level',
+            'EnergyCap': 'energy_limit_level',
+            'EnergyRechargeRate': 'energy_recharge_level',
+        }.get(upgrade_type)
+
+        if attribute is None:
+            raise GameError(f'Upgrade {upgrade_type} is unknown')
+
+        price = get_upgrade_price(getattr(self, attribute))
+        if self.coins < price:
+            raise GameError('Not enough coins')
+
+        self.regenerate()
+        self.coins -= price
+        setattr(self, attribute, getattr(self, attribute) + 1)
+
+        return self.to_game_config()
+
+    def start_tapbot(self) -> dict:
+        if not self.tapbot_purchased or self.tapbot_ends_at is not None or self.tapbot_used_attempts >= 3:
+            raise GameError('TapBot can not be started')
+
+        self.tapbot_used_attempts += 1
+        self.tapbot_starts_at = self.clock()
+        self.tapbot_ends_at = self.tapbot_starts_at + TAPBOT_DURATION
+
+        return self.to_tapbot_config()
+
+    def claim_tapbot(self) -> dict:
+        if self.tapbot_ends_at is None or self.clock() < self.tapbot_ends_at:
+            raise GameError('TapBot is not finished')
+
+        reward_amount = int((self.tapbot_ends_at - self.tapbot_starts_at) * (self.tap_bot_level or 1))
+        self.coins += reward_amount
+        self.coins_earned += reward_amount
+        self.tapbot_starts_at = self.tapbot_ends_at = None
+
+        return self.to_tapbot_config()
+
+    def spin_slot_machine(self, spins_count: int) -> dict:
+        if spins_count <= 0 or self.spin_energy < spins_count:
+            raise GameError('Not enough spin energy')
+
+        self.spin_energy -= spins_count
+        reward_amount = randint(0, 1_000) * spins_count
+        self.coins += reward_amount
+        self.coins_earned += reward_amount
+
+        return {
+            'gameConfig': self.to_game_config(),
+            'spinResults': [{
+                'id': uuid4().hex,
+                'combination': ['COIN', 'COIN', 'COIN'],
+                'rewardAmount': reward_amount,
+                'rewardType': 'COINS',
+                'questItemsFromSpin': [],
+                '__typename': 'SlotMachineSpinResult',
+            }],
+            'spinsProcessedCount': spins_count,
+            'previousProgressBarConfig': None,
+            'nextProgressBarConfig': None,
+            'progressBarReward': None,
+            '__typename': 'SlotMachineSpinV2Output',
+        }
+
+
+@dataclass(slots=True)
+class Faults:
+    latency: float = 0.
+    jitter: float = 0.
+    error_rate: float = 0.
+    rate_limit: int = 0
+
+
+class MockGameServer:
+    def __init__(self, faults: Faults, clock: Callable[[], float] = time):
+        self.faults = faults
+        self.clock = clock
+
+        self.accounts: dict[int, Account] = {}
+        self.tokens: dict[str, int] = {}
+        self.requests = 0
+
+    def login(self, variables: dict) -> dict:
+        user = variables['webAppData']['user']
+        account = self.accounts.get(user['id'])
+
+        if account is None:
+            account = self.accounts[user['id']] = Account(user_id=user['id'],
+                                                          first_name=user.get('first_name', ''),
+                                                          username=user.get('username', ''),
+                                                          clock=self.clock)
+
+        access_token = create_access_token(user_id=account.user_id, now=self.clock())
+        self.tokens[access_token] = account.user_id
+
+        return {'telegramUserLogin': {'access_token': access_token, '__typename': 'TelegramUserLoginOutput'}}
+
+    def get_account(self, authorization: str) -> Account | None:
+        user_id = self.tokens.get(authorization.removeprefix('Bearer '))
+
+        return self.accounts.get(user_id) if user_id is not None else None
+
+    def resolve(self, operation_name: str, variables: dict, account: Account) -> dict:
+        match operation_name:
+            case 'QueryTelegramUserMe':
+                return {'telegramUserMe': {'firstName': account.first_name, 'lastName': '',
+                                           'telegramId': account.user_id, 'username': account.username,
+                                           '_id': str(account.user_id), '__typename': 'TelegramUserMeOutput'}}
+            case 'QUERY_GAME_CONFIG':
+                return {'telegramGameGetConfig': account.to_game_config()}
+            case 'MutationGameProcessTapsBatch':
+                payload = variables['payload']
+                return {'telegramGameProcessTapsBatch': account.process_taps(nonce=payload['nonce'],
+                                                                             taps=payload['tapsCount'],
+                                                                             vector=payload['vector'])}
+            case 'telegramGameSetNextBoss':
+                return {'telegramGameSetNextBoss': account.set_next_boss()}
+            case 'telegramGameActivateBooster':
+                return {'telegramGameActivateBooster': account.activate_booster(variables['boosterType'])}
+            case 'telegramGamePurchaseUpgrade':
+                return {'telegramGamePurchaseUpgrade': account.purchase_upgrade(variables['upgradeType'])}
+            case 'TapbotConfig':
+                return {'telegramGameTapbotGetConfig': account.to_tapbot_config()}
+            case 'TapbotStart':
+                return {'telegramGameTapbotStart': account.start_tapbot()}
+            case 'TapbotClaim':
+                return {'telegramGameTapbotClaimCoins': account.claim_tapbot()}
+            case 'spinSlotMachine':
+                return {'slotMachineSpinV2': account.spin_slot_machine(variables['payload']['spinsCount'])}
+
+        raise GameError(f'Unknown operation {operation_name}')
+
+    def is_rate_limited(self, account: Account) -> bool:
+        if not self.faults.rate_limit:
+            return False
+
+        now = time()
+        account.request_times = [request_time for request_time in account.request_times if now - request_time < 1]
+        account.request_times.append(now)
+
+        return len(account.request_times) > self.faults.rate_limit
+
+    async def handle_graphql(self, request: web.Request) -> web.Response:
+        self.requests += 1
+
+        if self.faults.latency or self.faults.jitter:
+            await asyncio.sleep(max(self.faults.latency + uniform(-self.faults.jitter, self.faults.jitter), 0))
+
+        if random() < self.faults.error_rate:
+            return web.Response(status=500, reason='Injected error')
+
+        body = await request.json()
+        operation_name = body.get('operationName')
+        variables = body.get('variables') or {}
+
+        if operation_name == 'MutationTelegramUserLogin':
+            return web.json_response({'data': self.login(variables=variables)})
+
+        account = self.get_account(authorization=request.headers.get('Authorization', ''))
+        if account is None:
+            return web.Response(status=401, reason='Unauthorized')
+
+        if self.is_rate_limited(account=account):
+            return web.Response(status=429, reason='Too Many Requests', headers={'Retry-After': '1'})
+
+        try:
+            response_json = {'data': self.resolve(operation_name=operation_name, variables=variables, account=account)}
+        except GameError as error:
+            response_json = {'data': None, 'errors': [{'message': str(error)}]}
+
+        return web.json_response(response_json)
+
+    async def handle_faults(self, request: web.Request) -> web.Response:
+        if request.method == 'POST':
+            for key, value in (await request.json()).items():
+                if key in Faults.__annotations__:
+                    setattr(self.faults, key, Faults.__annotations__[key](value))
+
+        return web.json_response({'latency': self.faults.latency, 'jitter': self.faults.jitter,
+                                  'error_rate': self.faults.error_rate, 'rate_limit': self.faults.rate_limit,
+                                  'accounts': len(self.accounts), 'requests': self.requests})
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/graphql', self.handle_graphql)
+        app.router.add_route('*', '/faults', self.handle_faults)
+
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the MemeFi GraphQL API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0, help='Response delay in seconds')
+    parser.add_argument('--jitter', type=float, default=0, help='Random +/- added to the delay in seconds')
+    parser.add_argument('--error-rate', type=float, default=0, help='Share of requests answered with 500')
+    parser.add_argument('--rate-limit', type=int, default=0, help='Requests per second per account before 429')
+    args = parser.parse_args()
+
+    server = MockGameServer(faults=Faults(latency=args.latency, jitter=args.jitter,
+                                          error_rate=args.error_rate, rate_limit=args.rate_limit))
+
+    print(f"GraphQL: http://{args.host}:{args.port}/graphql | Faults: http://{args.host}:{args.port}/faults")
+    web.run_app(server.create_app(), host=args.host, port=args.port, access_log=None, print=None)
+
+
+if __name__ == '__main__':
+    main()
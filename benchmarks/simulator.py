@@ -0,0 +1,226 @@
+import os
+import sys
+import json
+import random
+import asyncio
+import argparse
+import itertools
+from time import time
+from pathlib import Path
+from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault('API_ID', '1')
+os.environ.setdefault('API_HASH', 'simulator')
+
+from loguru import logger
+
+from bot.config.config import Settings, settings
+from bot.utils.graphql import OperationName
+from bot.utils.json_codec import dumps, loads
+from bot.utils.session_store import session_store
+from bot.exceptions import InvalidSession, InvalidProtocol, InvalidAccessToken
+from bot.core.tapper import Tapper
+from bot.core.refresh import refresh_coordinator
+from mock_server import MockGameServer, Faults, GameError
+from stub_client import StubClient
+
+
+HOURS = 24
+ACCOUNTS = 8
+REQUEST_LATENCY = .2
+
+
+class VirtualClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SimulatedExecutor:
+    def __init__(self, server: MockGameServer, clock: VirtualClock, latency: float):
+        self.server = server
+        self.clock = clock
+        self.latency = latency
+        self.proxy = None
+
+        self.headers = {}
+        self.requests = 0
+        self.errors = 0
+
+    async def execute(self,
+                      operation_name: OperationName,
+                      variables: dict[str, Any] | None = None,
+                      path: str | tuple[str, ...] = (),
+                      default: Any = None) -> Any:
+        self.requests += 1
+        self.clock.now += self.latency
+
+        variables = loads(dumps(variables or {}))
+
+        try:
+            if operation_name == OperationName.MutationTelegramUserLogin:
+                result = self.server.login(variables=variables)
+            else:
+                account = self.server.get_account(authorization=self.headers.get('Authorization', ''))
+                if account is None:
+                    self.errors += 1
+                    raise InvalidAccessToken(operation_name.value)
+
+                result = self.server.resolve(operation_name=operation_name.value, variables=variables,
+                                             account=account)
+        except GameError as error:
+            self.errors += 1
+            raise InvalidProtocol(f'{operation_name.value} msg: {error}')
+
+        for key in (path,) if isinstance(path, str) else path:
+            result = (result or {}).get(key)
+
+        return result or default
+
+
+def init_worker() -> None:
+    logger.remove()
+
+    session_store.path = ':memory:'
+    refresh_coordinator.configure(concurrency=1, rate=0)
+
+
+async def simulate_account(config: Settings, user_id: int, hours: float, latency: float) -> dict:
+    clock = VirtualClock(now=time())
+    server = MockGameServer(faults=Faults(), clock=clock)
+    api = SimulatedExecutor(server=server, clock=clock, latency=latency)
+    tg_client = StubClient(user_id=user_id, clock=clock)
+
+    session_store.delete_access_token(session_name=tg_client.name)
+
+    tapper = Tapper(tg_client=tg_client, api=api, clock=clock, config=config)
+    ends_at = clock.now + hours * 3600
+
+    while clock.now < ends_at:
+        try:
+            delay = await tapper.step()
+        except (InvalidProtocol, InvalidSession):
+            delay = None
+
+        if delay is None:
+            break
+
+        clock.now += delay
+
+    account = server.accounts[user_id]
+
+    return {
+        'coins_earned': account.coins_earned,
+        'requests': api.requests,
+        'errors': api.errors,
+        'boss_level': account.boss_level,
+        'weapon_level': account.weapon_level,
+        'energy_limit_level': account.energy_limit_level,
+        'energy_recharge_level': account.energy_recharge_level,
+    }
+
+
+def simulate(overrides: dict, seed: int, hours: float, latency: float) -> dict:
+    random.seed(seed)
+
+    config = Settings.model_validate({**settings.model_dump(), **overrides})
+
+    return asyncio.run(simulate_account(config=config, user_id=seed, hours=hours, latency=latency))
+
+
+def run_simulation(task: tuple[dict, int, float, float]) -> dict:
+    overrides, seed, hours, latency = task
+
+    return simulate(overrides=overrides, seed=seed, hours=hours, latency=latency)
+
+
+def parse_value(value: str):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def parse_grid(params: list[str]) -> list[dict]:
+    names = []
+    values = []
+
+    for param in params:
+        name, _, raw_values = param.partition('=')
+
+        if name not in Settings.model_fields or not raw_values:
+            raise ValueError(f'Invalid parameter: {param}')
+
+        names.append(name)
+        values.append([parse_value(value) for value in raw_values.split(';')])
+
+    grid = [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+    for overrides in grid:
+        Settings.model_validate({**settings.model_dump(), **overrides})
+
+    return grid
+
+
+def summarize(overrides: dict, runs: list[dict], hours: float) -> dict:
+    coins = sum(run['coins_earned'] for run in runs)
+    requests = sum(run['requests'] for run in runs)
+
+    return {
+        'overrides': overrides,
+        'coins_per_hour': round(coins / len(runs) / hours, 1),
+        'requests_per_coin': round(requests / coins, 5) if coins else None,
+        'errors_per_hour': round(sum(run['errors'] for run in runs) / len(runs) / hours, 2),
+        'boss_level': round(sum(run['boss_level'] for run in runs) / len(runs), 2),
+        'runs': runs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate tapper strategies in virtual time and sweep settings',
+                                     epilog='Example: --param MAX_TAP_LEVEL=5;10 --param '
+                                            '"SLEEP_BY_MIN_ENERGY=[1800,3600];600"')
+    parser.add_argument('--param', action='append', default=[],
+                        help='Setting to sweep as NAME=value1;value2, values are JSON or plain strings')
+    parser.add_argument('--hours', type=float, default=HOURS, help='Virtual hours simulated per account')
+    parser.add_argument('--accounts', type=int, default=ACCOUNTS, help='Accounts simulated per configuration')
+    parser.add_argument('--latency', type=float, default=REQUEST_LATENCY, help='Virtual seconds per request')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Worker processes')
+    parser.add_argument('--output', help='Path of the JSON results')
+    args = parser.parse_args()
+
+    try:
+        grid = parse_grid(params=args.param)
+    except ValueError as error:
+        parser.error(str(error))
+
+    tasks = [(overrides, seed, args.hours, args.latency) for overrides in grid for seed in range(1, args.accounts + 1)]
+
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker) as executor:
+        runs = list(executor.map(run_simulation, tasks, chunksize=max(len(tasks) // (args.jobs * 4), 1)))
+
+    results = [summarize(overrides=overrides, runs=runs[index * args.accounts:(index + 1) * args.accounts],
+                         hours=args.hours)
+               for index, overrides in enumerate(grid)]
+    results.sort(key=lambda result: -result['coins_per_hour'])
+
+    for result in results:
+        description = ' '.join(f'{name}={value}' for name, value in result['overrides'].items()) or 'defaults'
+        requests_per_coin = result['requests_per_coin'] or 0
+
+        print(f"{result['coins_per_hour']:>12,.0f} coins/h | {requests_per_coin * 1000:>8.3f} req/1k coins | "
+              f"boss {result['boss_level']:>6.1f} | errors {result['errors_per_hour']:>6.2f}/h | {description}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({'hours': args.hours, 'accounts': args.accounts, 'latency_s': args.latency,
+                       'results': results}, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import json
+from time import time
+from uuid import uuid4
+from typing import Callable
+from types import SimpleNamespace
+from urllib.parse import quote
+
+from pyrogram.raw.types import InputPeerUser
+
+
+class StubClient:
+    def __init__(self, user_id: int, clock: Callable[[], float] = time):
+        self.name = f'bench_{user_id}'
+        self.user_id = user_id
+        self.clock = clock
+        self.proxy = None
+        self.is_connected = False
+
+    async def connect(self) -> None:
+        self.is_connected = True
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+
+    async def get_me(self) -> SimpleNamespace:
+        return SimpleNamespace(id=self.user_id, first_name=self.name, last_name=None, username=self.name,
+                               language_code='en')
+
+    async def resolve_peer(self, username: str) -> InputPeerUser:
+        return InputPeerUser(user_id=1, access_hash=1)
+
+    async def invoke(self, query) -> SimpleNamespace:
+        user = quote(json.dumps({'id': self.user_id, 'first_name': self.name}))
+        tg_web_data = quote(f'query_id=AA{self.user_id}&user={user}&auth_date={int(self.clock())}'
+                            f'&hash={uuid4().hex}')
+
+        return SimpleNamespace(url=f'https://tg-app.memefi.club/game#tgWebAppData={tg_web_data}&tgWebAppVersion=7.10')
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -25,9 +25,34 @@ class Settings(BaseSettings):
     APPLY_DAILY_TURBO: bool = True
 
     RANDOM_TAPS_COUNT: list[int] = [15, 75]
+    ADAPTIVE_TAPS: bool = True
+    MAX_TAPS_PER_BATCH: int = 500
     SLEEP_BETWEEN_TAP: list[int] = [15, 25]
 
     USE_PROXY_FROM_FILE: bool = False
+    PROXY_CHECK_INTERVAL: int = 300
+    PROXY_MAX_CONCURRENT_REQUESTS: int = 20
+    PROXY_REQUESTS_PER_SECOND: float = 10
+
+    GRAPHQL_URL: str = 'https://api-gw-tg.memefi.club/graphql'
+    USE_PERSISTED_QUERIES: bool = False
+
+    SCHEDULER_WORKERS: int = 100
+    SESSIONS_RAMP_UP_RATE: int = 50
+    EVENT_LOOP: Literal['auto', 'uvloop', 'asyncio'] = 'auto'
+
+    METRICS_HOST: str = '127.0.0.1'
+    METRICS_PORT: int = 0
+    METRICS_PER_SESSION: bool = False
+    PROFILE_DURATION: int = 60
+
+    LOG_LEVEL: str = 'INFO'
+    LOG_JSON: bool = False
+    LOG_TAPS_SUMMARY_INTERVAL: int = 0
+
+    TG_REFRESH_CONCURRENCY: int = 5
+    TG_REFRESH_RATE: float = 1
+    TG_CLIENTS_POOL_SIZE: int = 0
 
     USE_TAP_BOT: bool = False
     EMERGENCY_STOP: bool = False
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+from pyrogram import Client
+from pyrogram.errors import Unauthorized, UserDeactivated, AuthKeyUnregistered
+
+from bot.config import settings
+from bot.exceptions import InvalidSession
+
+
+class ClientPool:
+    def __init__(self, size: int):
+        self.size = size
+
+        self.clients: OrderedDict[str, Client] = OrderedDict()
+        self.in_use: set[str] = set()
+
+    async def acquire(self, tg_client: Client, proxy: dict | None) -> None:
+        if tg_client.is_connected and tg_client.proxy != proxy:
+            await self.disconnect(tg_client=tg_client)
+
+        tg_client.proxy = proxy
+
+        if not tg_client.is_connected:
+            try:
+                await tg_client.connect()
+            except (Unauthorized, UserDeactivated, AuthKeyUnregistered):
+                raise InvalidSession(tg_client.name)
+
+        self.in_use.add(tg_client.name)
+        self.clients[tg_client.name] = tg_client
+        self.clients.move_to_end(tg_client.name)
+
+        await self.evict()
+
+    async def release(self, tg_client: Client) -> None:
+        self.in_use.discard(tg_client.name)
+
+        if tg_client.name in self.clients:
+            self.clients.move_to_end(tg_client.name)
+
+        await self.evict()
+
+    async def evict(self) -> None:
+        for name, tg_client in list(self.clients.items()):
+            if len(self.clients) <= self.size:
+                break
+
+            if name not in self.in_use:
+                await self.disconnect(tg_client=tg_client)
+
+    async def disconnect(self, tg_client: Client) -> None:
+        self.clients.pop(tg_client.name, None)
+
+        if tg_client.is_connected:
+            await tg_client.disconnect()
+
+    async def close(self) -> None:
+        for tg_client in list(self.clients.values()):
+            await self.disconnect(tg_client=tg_client)
+
+
+client_pool = ClientPool(size=max(settings.TG_CLIENTS_POOL_SIZE, settings.TG_REFRESH_CONCURRENCY)
+                         if settings.TG_CLIENTS_POOL_SIZE > 0 else 0)
@@ -0,0 +1,230 @@
+import asyncio
+from time import monotonic
+from random import uniform
+from typing import Any, NamedTuple
+
+import aiohttp
+
+from bot.config import settings
+from bot.utils import logger
+from bot.utils.graphql import Query, OperationName
+from bot.utils.json_codec import encode_request, loads
+from bot.utils.stats import stats
+from bot.utils.metrics import graphql_latency, graphql_requests, graphql_retries, graphql_errors
+from bot.exceptions import InvalidProtocol, InvalidAccessToken, RequestDeferred
+from .transport import get_http_client, get_request_limiter
+from .profiler import profiler
+
+
+class RetryPolicy(NamedTuple):
+    attempts: int = 5
+    base_delay: float = 1
+    max_delay: float = 15
+    deadline: float = 60
+    timeout: float = 20
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+RETRY_POLICIES = {
+    OperationName.MutationTelegramUserLogin: RetryPolicy(attempts=5, deadline=90),
+    OperationName.QueryTelegramUserMe: RetryPolicy(attempts=2, deadline=30),
+    OperationName.MutationGameProcessTapsBatch: RetryPolicy(attempts=3, max_delay=8, deadline=30),
+    OperationName.telegramGameSetNextBoss: RetryPolicy(attempts=3, deadline=30),
+    OperationName.telegramGameActivateBooster: RetryPolicy(attempts=2, deadline=30),
+    OperationName.telegramGamePurchaseUpgrade: RetryPolicy(attempts=2, deadline=30),
+    OperationName.SpinSlotMachine: RetryPolicy(attempts=2, deadline=30),
+}
+
+
+PERSISTED_QUERY_NOT_FOUND = ('PersistedQueryNotFound', 'PERSISTED_QUERY_NOT_FOUND')
+PERSISTED_QUERY_NOT_SUPPORTED = ('PersistedQueryNotSupported', 'PERSISTED_QUERY_NOT_SUPPORTED')
+
+
+class RetryableError(Exception):
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def get_retry_after(response: aiohttp.ClientResponse) -> float | None:
+    retry_after = response.headers.get('Retry-After', '')
+
+    return float(retry_after) if retry_after.isdigit() else None
+
+
+def format_error(error: BaseException) -> str:
+    return str(error) or type(error).__name__
+
+
+def get_persisted_query_error(response_json: dict[str, Any]) -> str | None:
+    for error in response_json.get('errors') or []:
+        code = (error.get('extensions') or {}).get('code')
+
+        for reason in (error.get('message'), code):
+            if reason in PERSISTED_QUERY_NOT_FOUND or reason in PERSISTED_QUERY_NOT_SUPPORTED:
+                return reason
+
+    return None
+
+
+class GraphQLExecutor:
+    persisted_queries = settings.USE_PERSISTED_QUERIES
+
+    def __init__(self, session_name: str, proxy: str | None, url: str = settings.GRAPHQL_URL):
+        self.session_name = session_name
+        self.proxy = proxy
+        self.url = url
+
+        self.headers = {}
+        self.requests = 0
+        self.retries: dict[OperationName, tuple[int, float]] = {}
+        self.limiter_reserved = False
+
+    async def post(self, operation_name: OperationName, body: bytes, timeout: float) -> dict[str, Any]:
+        limiter = get_request_limiter(proxy=self.proxy)
+
+        if limiter.busy:
+            raise RequestDeferred(delay=limiter.defer())
+
+        if not self.limiter_reserved:
+            delay = limiter.reserve()
+
+            if delay > 0:
+                self.limiter_reserved = True
+                raise RequestDeferred(delay=delay)
+
+        self.limiter_reserved = False
+
+        http_client = get_http_client(proxy=self.proxy)
+        self.requests += 1
+        stats.increment(name='requests')
+        graphql_requests.inc(operation_name.value)
+
+        async with limiter.slot():
+            started_at = monotonic()
+
+            async with http_client.post(url=self.url, data=body, headers=self.headers,
+                                        timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                graphql_latency.observe(operation_name.value, value=monotonic() - started_at)
+
+                if response.status == 401:
+                    raise InvalidAccessToken(f'{operation_name.value} msg: {response.reason}')
+
+                if response.status == 429 or response.status >= 500:
+                    raise RetryableError(f'{response.status} {response.reason}', retry_after=get_retry_after(response))
+
+                try:
+                    response_body = await response.read()
+
+                    with profiler.span(name='json.decode'):
+                        response_json = loads(response_body)
+                except ValueError:
+                    response.raise_for_status()
+                    raise RetryableError(f'Invalid JSON response ({response.content_type})')
+
+                if response.status == 400 and isinstance(response_json, dict) and response_json.get('errors'):
+                    return response_json
+
+                response.raise_for_status()
+
+                return response_json
+
+    async def post_persisted(self, operation_name: OperationName, persisted_body: bytes, body: bytes,
+                             timeout: float) -> dict[str, Any]:
+        response_json = await self.post(operation_name=operation_name, body=persisted_body, timeout=timeout)
+
+        reason = get_persisted_query_error(response_json)
+        if reason is None:
+            return response_json
+
+        if reason in PERSISTED_QUERY_NOT_SUPPORTED:
+            logger.warning(f"{self.session_name} | Persisted queries are not supported, sending full queries")
+            GraphQLExecutor.persisted_queries = False
+
+        return await self.post(operation_name=operation_name, body=body, timeout=timeout)
+
+    async def execute(self,
+                      operation_name: OperationName,
+                      variables: dict[str, Any] | None = None,
+                      path: str | tuple[str, ...] = (),
+                      default: Any = None) -> Any:
+        policy = RETRY_POLICIES.get(operation_name, DEFAULT_RETRY_POLICY)
+        path = (path,) if isinstance(path, str) else path
+
+        query = Query[operation_name.name]
+        query_hash = query.sha256_hash if self.persisted_queries else None
+
+        with profiler.span(name='json.encode'):
+            body = encode_request(operation_name=operation_name.value,
+                                  variables=variables,
+                                  query=query.value,
+                                  query_hash=query_hash)
+            persisted_body = encode_request(operation_name=operation_name.value,
+                                            variables=variables,
+                                            query_hash=query_hash) if query_hash else None
+
+        now = asyncio.get_running_loop().time()
+
+        attempt, deadline = self.retries.pop(operation_name, (1, now + policy.deadline))
+        if deadline <= now:
+            attempt, deadline = 1, now + policy.deadline
+
+        try:
+            timeout = min(deadline - now, policy.timeout)
+
+            with profiler.span(name=f'graphql.{operation_name.value}'):
+                if persisted_body is not None and self.persisted_queries:
+                    response_json = await self.post_persisted(operation_name=operation_name,
+                                                              persisted_body=persisted_body,
+                                                              body=body,
+                                                              timeout=timeout)
+                else:
+                    response_json = await self.post(operation_name=operation_name, body=body, timeout=timeout)
+
+            if response_json.get('errors'):
+                graphql_errors.inc(operation_name.value, 'InvalidProtocol')
+                raise InvalidProtocol(f'{operation_name.value} msg: {response_json["errors"][0]["message"]}')
+
+            result = response_json.get('data') or {}
+            for key in path:
+                result = (result or {}).get(key)
+
+            if not result:
+                raise RetryableError('Empty response data')
+
+            return result
+
+        except (RetryableError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+            graphql_errors.inc(operation_name.value, type(error).__name__)
+
+            if attempt == policy.attempts:
+                logger.error(f"{self.session_name} | ❗️ {operation_name.value} failed "
+                             f"after {attempt} attempts: {format_error(error)}")
+                return default
+
+            delay = min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1)) * uniform(.5, 1)
+            if isinstance(error, RetryableError) and error.retry_after is not None:
+                delay = max(delay, error.retry_after)
+
+            if asyncio.get_running_loop().time() + delay >= deadline:
+                logger.error(f"{self.session_name} | ❗️ {operation_name.value} deadline exceeded: "
+                             f"{format_error(error)}")
+                return default
+
+            logger.warning(f"{self.session_name} | {operation_name.value} failed: "
+                           f"{format_error(error)} | Retry in <lw>{delay:.1f}s</lw>")
+            graphql_retries.inc(operation_name.value)
+            self.retries[operation_name] = (attempt + 1, deadline)
+
+            raise RequestDeferred(delay=delay)
+
+        except RequestDeferred:
+            self.retries[operation_name] = (attempt, deadline)
+            raise
+
+        except aiohttp.ClientError as error:
+            graphql_errors.inc(operation_name.value, type(error).__name__)
+            logger.error(f"{self.session_name} | ❗️ {operation_name.value} failed: {error}")
+
+        return default
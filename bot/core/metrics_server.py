@@ -0,0 +1,50 @@
+import asyncio
+
+from aiohttp import web
+
+from bot.utils import logger
+from bot.utils.metrics import registry, event_loop_lag
+
+
+LAG_SAMPLE_INTERVAL = .5
+
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    return web.Response(text=registry.render(), content_type='text/plain')
+
+
+async def sample_event_loop_lag() -> None:
+    loop = asyncio.get_running_loop()
+
+    while True:
+        started_at = loop.time()
+        await asyncio.sleep(LAG_SAMPLE_INTERVAL)
+        event_loop_lag.observe(value=max(loop.time() - started_at - LAG_SAMPLE_INTERVAL, 0))
+
+
+class MetricsServer:
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+
+        self.runner: web.AppRunner | None = None
+        self.lag_sampler: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/metrics', handle_metrics)
+
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host=self.host, port=self.port).start()
+
+        self.lag_sampler = asyncio.create_task(sample_event_loop_lag())
+
+        logger.info(f"Metrics are served on <lc>http://{self.host}:{self.port}/metrics</lc>")
+
+    async def stop(self) -> None:
+        if self.lag_sampler:
+            self.lag_sampler.cancel()
+
+        if self.runner:
+            await self.runner.cleanup()
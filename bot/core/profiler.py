@@ -0,0 +1,114 @@
+import os
+import io
+import signal
+import asyncio
+import cProfile
+import pstats
+from time import perf_counter, strftime
+from contextlib import contextmanager, nullcontext
+
+from bot.utils import logger
+
+
+LAG_SAMPLE_INTERVAL = .1
+REPORT_DIR = 'profiles'
+REPORT_FUNCTIONS = 40
+
+
+class Profiler:
+    def __init__(self):
+        self.active = False
+
+        self.spans: dict[str, list[float]] = {}
+        self.lags: list[float] = []
+
+    @contextmanager
+    def _measure(self, name: str):
+        started_at = perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - started_at
+            span = self.spans.get(name)
+
+            if span is None:
+                self.spans[name] = [1, elapsed, elapsed]
+            else:
+                span[0] += 1
+                span[1] += elapsed
+                span[2] = max(span[2], elapsed)
+
+    def span(self, name: str):
+        return self._measure(name=name) if self.active else nullcontext()
+
+    async def sample_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            started_at = loop.time()
+            await asyncio.sleep(LAG_SAMPLE_INTERVAL)
+            self.lags.append(max(loop.time() - started_at - LAG_SAMPLE_INTERVAL, 0))
+
+    def start(self, duration: float) -> None:
+        if self.active:
+            logger.warning("Profiling is already running")
+            return
+
+        asyncio.get_running_loop().create_task(self.run(duration=duration))
+
+    async def run(self, duration: float) -> None:
+        self.active = True
+        self.spans.clear()
+        self.lags.clear()
+
+        logger.info(f"Profiling for <lc>{duration:,.0f}</lc>s")
+
+        profile = cProfile.Profile()
+        lag_sampler = asyncio.create_task(self.sample_lag())
+        started_at = perf_counter()
+
+        profile.enable()
+
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profile.disable()
+            lag_sampler.cancel()
+            self.active = False
+
+            path = self.write_report(profile=profile, elapsed=perf_counter() - started_at)
+            logger.info(f"Profiling report saved to <lc>{path}</lc>")
+
+    def write_report(self, profile: cProfile.Profile, elapsed: float) -> str:
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        path = os.path.join(REPORT_DIR, f'profile-{os.getpid()}-{strftime("%Y%m%d-%H%M%S")}.txt')
+
+        lags = sorted(self.lags)
+        lines = [f'Duration: {elapsed:.1f}s', '', 'Event loop lag:']
+
+        if lags:
+            for label, quantile in (('p50', .5), ('p90', .9), ('p99', .99)):
+                lines.append(f'  {label}: {lags[min(int(len(lags) * quantile), len(lags) - 1)] * 1000:.1f}ms')
+            lines.append(f'  max: {lags[-1] * 1000:.1f}ms over {len(lags)} samples')
+
+        lines += ['', f'{"Span":<40} {"count":>8} {"total s":>10} {"avg ms":>10} {"max ms":>10}']
+
+        for name, (count, total, maximum) in sorted(self.spans.items(), key=lambda item: -item[1][1]):
+            lines.append(f'{name:<40} {count:>8} {total:>10.2f} {total / count * 1000:>10.2f} {maximum * 1000:>10.2f}')
+
+        stream = io.StringIO()
+        pstats.Stats(profile, stream=stream).sort_stats('cumulative').print_stats(REPORT_FUNCTIONS)
+        lines += ['', stream.getvalue()]
+
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines))
+
+        return path
+
+    def install_signal_handler(self, duration: float) -> None:
+        if hasattr(signal, 'SIGUSR1'):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, self.start, duration)
+
+
+profiler = Profiler()
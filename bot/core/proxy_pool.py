@@ -0,0 +1,114 @@
+import asyncio
+from time import monotonic
+from dataclasses import dataclass
+
+import aiohttp
+
+from bot.utils import logger
+from .transport import get_http_client, get_request_limiter
+
+
+PROBE_URL = 'https://api.ipify.org?format=json'
+PROBE_TIMEOUT = 10
+PROBE_CONCURRENCY = 100
+SMOOTHING = .5
+MAX_FAILURE_RATE = .5
+
+
+@dataclass(slots=True)
+class ProxyState:
+    proxy: str
+    ip: str | None = None
+    latency: float = PROBE_TIMEOUT
+    failure_rate: float = 0.
+    probes: int = 0
+    assigned: int = 0
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.probes > 0 and self.failure_rate < MAX_FAILURE_RATE
+
+    @property
+    def load(self) -> float:
+        return (self.assigned + 1) * self.latency
+
+    def observe(self, latency: float | None) -> None:
+        failed = latency is None
+
+        if self.probes:
+            self.failure_rate += (failed - self.failure_rate) * SMOOTHING
+
+            if not failed:
+                self.latency += (latency - self.latency) * SMOOTHING
+        else:
+            self.failure_rate = float(failed)
+
+            if not failed:
+                self.latency = latency
+
+        self.probes += 1
+
+
+class ProxyPool:
+    def __init__(self, proxies: list[str], check_interval: int):
+        self.states = {proxy: ProxyState(proxy=proxy) for proxy in proxies}
+        self.check_interval = check_interval
+
+        self.semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+    async def probe(self, state: ProxyState) -> None:
+        async with self.semaphore:
+            started_at = monotonic()
+
+            try:
+                http_client = get_http_client(proxy=state.proxy)
+                async with http_client.get(url=PROBE_URL, timeout=aiohttp.ClientTimeout(PROBE_TIMEOUT)) as response:
+                    response.raise_for_status()
+                    state.ip = (await response.json(content_type=None)).get('ip')
+            except Exception as error:
+                was_healthy = state.is_healthy
+                state.observe(latency=None)
+
+                if was_healthy != state.is_healthy or state.probes == 1:
+                    logger.warning(f"Proxy: {state.proxy} | Probe failed: {error or type(error).__name__}")
+            else:
+                state.observe(latency=monotonic() - started_at)
+
+    async def probe_all(self) -> None:
+        await asyncio.gather(*(self.probe(state=state) for state in self.states.values()))
+
+        healthy = [state for state in self.states.values() if state.is_healthy]
+        latency = sum(state.latency for state in healthy) / len(healthy) if healthy else 0
+        wait_time = max(get_request_limiter(proxy=proxy).average_wait_time for proxy in self.states)
+
+        logger.info(f"Proxies healthy: <lg>{len(healthy)}</lg>/<lc>{len(self.states)}</lc> | "
+                    f"Average latency: <lc>{latency * 1000:,.0f}</lc>ms | "
+                    f"Max queue wait: <lc>{wait_time * 1000:,.0f}</lc>ms")
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.probe_all()
+
+    def acquire(self) -> str:
+        candidates = [state for state in self.states.values() if state.is_healthy] or list(self.states.values())
+        state = min(candidates, key=lambda candidate: candidate.load)
+        state.assigned += 1
+
+        return state.proxy
+
+    def release(self, proxy: str | None) -> None:
+        state = self.states.get(proxy)
+
+        if state is not None and state.assigned > 0:
+            state.assigned -= 1
+
+    def reassign(self, proxy: str | None) -> str | None:
+        state = self.states.get(proxy)
+
+        if state is None or state.is_healthy or not any(other.is_healthy for other in self.states.values()):
+            return proxy
+
+        self.release(proxy=proxy)
+
+        return self.acquire()
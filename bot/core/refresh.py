@@ -0,0 +1,33 @@
+import asyncio
+from time import time
+from random import uniform
+
+from bot.config import settings
+from bot.utils.rate_limit import TokenBucket
+
+
+TOKEN_REFRESH_MARGIN = 300
+REFRESH_SPREAD = .25
+
+
+class RefreshCoordinator:
+    def __init__(self, concurrency: int, rate: float):
+        self.configure(concurrency=concurrency, rate=rate)
+
+    def configure(self, concurrency: int, rate: float) -> None:
+        self.semaphore = asyncio.Semaphore(max(concurrency, 1))
+        self.bucket = TokenBucket(rate=rate, burst=concurrency)
+
+    def reserve(self) -> float:
+        return self.bucket.reserve()
+
+    @staticmethod
+    def get_refresh_time(expires_at: float, now: float | None = None) -> float:
+        now = time() if now is None else now
+        refresh_at = expires_at - TOKEN_REFRESH_MARGIN
+
+        return refresh_at - uniform(0, max(refresh_at - now, 0) * REFRESH_SPREAD)
+
+
+refresh_coordinator = RefreshCoordinator(concurrency=settings.TG_REFRESH_CONCURRENCY,
+                                         rate=settings.TG_REFRESH_RATE)
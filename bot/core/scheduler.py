@@ -0,0 +1,112 @@
+import heapq
+import asyncio
+from itertools import count
+from typing import Iterable
+from contextlib import suppress
+
+from bot.utils import logger
+from bot.utils.stats import stats
+from bot.utils.session_store import session_store
+from bot.exceptions import InvalidSession, InvalidProtocol
+from .tapper import Tapper
+
+
+class Scheduler:
+    def __init__(self, workers: int):
+        self.workers = workers
+
+        self.heap: list[tuple[float, int, Tapper]] = []
+        self.counter = count()
+        self.accounts = 0
+        self.feeding = False
+
+        self.ready: asyncio.Queue[Tapper] = asyncio.Queue(maxsize=workers)
+        self.wakeup = asyncio.Event()
+
+    def add(self, tapper: Tapper, delay: float = 0) -> None:
+        self.accounts += 1
+        stats.increment(name='accounts')
+        self.schedule(tapper=tapper, delay=delay)
+
+    def schedule(self, tapper: Tapper, delay: float) -> None:
+        due = asyncio.get_running_loop().time() + delay
+
+        heapq.heappush(self.heap, (due, next(self.counter), tapper))
+        self.wakeup.set()
+
+    def remove(self, tapper: Tapper) -> None:
+        self.accounts -= 1
+        tapper.release()
+        stats.increment(name='accounts', value=-1)
+        self.wakeup.set()
+
+    async def dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while self.accounts > 0 or self.feeding:
+            self.wakeup.clear()
+
+            if not self.heap:
+                await self.wakeup.wait()
+                continue
+
+            due, _, tapper = self.heap[0]
+            delay = due - loop.time()
+
+            if delay > 0:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=delay)
+                continue
+
+            heapq.heappop(self.heap)
+            await self.ready.put(tapper)
+
+    async def work(self) -> None:
+        while True:
+            tapper = await self.ready.get()
+
+            try:
+                delay = await tapper.step()
+            except InvalidProtocol as error:
+                logger.error(f"{tapper.session_name} | Invalid protocol detected at {error}")
+                delay = None
+            except InvalidSession:
+                logger.error(f"{tapper.session_name} | Invalid Session")
+                session_store.set_session_invalid(session_name=tapper.session_name)
+                delay = None
+            except Exception as error:
+                logger.error(f"{tapper.session_name} | ❗️ Unknown error: {error}")
+                delay = 3
+
+            if delay is None:
+                self.remove(tapper=tapper)
+            else:
+                self.schedule(tapper=tapper, delay=delay)
+
+    async def feed(self, tappers: Iterable[Tapper], ramp_up_rate: int) -> None:
+        try:
+            for index, tapper in enumerate(tappers, start=1):
+                self.add(tapper=tapper)
+
+                if ramp_up_rate > 0 and index % ramp_up_rate == 0:
+                    await asyncio.sleep(1)
+        finally:
+            self.feeding = False
+            self.wakeup.set()
+
+    async def run(self, tappers: Iterable[Tapper], ramp_up_rate: int = 0) -> None:
+        self.feeding = True
+
+        workers = [asyncio.create_task(self.work()) for _ in range(self.workers)]
+        feeder = asyncio.create_task(self.feed(tappers=tappers, ramp_up_rate=ramp_up_rate))
+
+        try:
+            await self.dispatch()
+            await feeder
+        finally:
+            feeder.cancel()
+
+            for worker in workers:
+                worker.cancel()
+
+            await asyncio.gather(feeder, *workers, return_exceptions=True)
@@ -0,0 +1,156 @@
+import os
+import sys
+import signal
+import asyncio
+import multiprocessing
+from zlib import crc32
+from queue import Empty
+from typing import Callable
+
+from bot.utils import logger
+from bot.utils.stats import stats, get_requests_per_1k_coins
+
+
+STATS_INTERVAL = 60
+RESTART_DELAY = 5
+
+
+def get_shard(key: str, shards_count: int) -> int:
+    return crc32(key.encode()) % shards_count
+
+
+async def report_stats(queue, shard_index: int) -> None:
+    while True:
+        await asyncio.sleep(STATS_INTERVAL / 2)
+        queue.put(('stats', shard_index, stats.snapshot()))
+
+
+class Supervisor:
+    def __init__(self, target: Callable, workers: int, proxies: list[str], profile_duration: int = 0):
+        self.target = target
+        self.workers = workers
+        self.proxies = proxies
+        self.profile_duration = profile_duration
+
+        self.context = multiprocessing.get_context('spawn')
+        self.queue = self.context.Queue()
+        self.colorize = sys.stdout.isatty()
+
+        self.processes: dict[int, multiprocessing.Process] = {}
+        self.restart_at: dict[int, float] = {}
+        self.shard_stats: dict[int, dict[str, int]] = {}
+        self.finished_stats: dict[str, int] = {}
+
+    def get_shard_proxies(self, shard_index: int) -> list[str]:
+        if len(self.proxies) < self.workers:
+            return self.proxies
+
+        return self.proxies[shard_index::self.workers]
+
+    def get_proxy_shares(self) -> int:
+        return 1 if len(self.proxies) >= self.workers else self.workers
+
+    def start_shard(self, shard_index: int) -> None:
+        process = self.context.Process(target=self.target,
+                                       args=(shard_index, self.workers, self.get_shard_proxies(shard_index),
+                                             self.get_proxy_shares(), self.profile_duration, self.queue,
+                                             self.colorize),
+                                       name=f'shard-{shard_index}',
+                                       daemon=True)
+        process.start()
+
+        self.processes[shard_index] = process
+
+    def drain_queue(self) -> None:
+        while True:
+            try:
+                message = self.queue.get_nowait()
+            except Empty:
+                break
+
+            if message[0] == 'log':
+                sys.stdout.write(message[1])
+            elif message[0] == 'stats':
+                self.shard_stats[message[1]] = message[2]
+
+        sys.stdout.flush()
+
+    def retire_stats(self, shard_index: int) -> None:
+        for name, value in self.shard_stats.pop(shard_index, {}).items():
+            if name == 'accounts':
+                continue
+
+            self.finished_stats[name] = self.finished_stats.get(name, 0) + value
+
+    def log_stats(self) -> None:
+        totals = dict(self.finished_stats)
+
+        for shard_stats in self.shard_stats.values():
+            for name, value in shard_stats.items():
+                totals[name] = totals.get(name, 0) + value
+
+        queue_wait = totals.get('queue_wait_ms', 0) / max(totals.get('requests', 0), 1)
+        requests_per_1k_coins = get_requests_per_1k_coins(requests=totals.get('requests', 0),
+                                                          coins=totals.get('coins', 0))
+
+        logger.info(f"Shards: <lc>{len(self.processes)}</lc>/<lc>{self.workers}</lc> | "
+                    f"Accounts: <lc>{totals.get('accounts', 0):,}</lc> | "
+                    f"Requests: <lc>{totals.get('requests', 0):,}</lc> | "
+                    f"Queue wait: <lc>{queue_wait:,.0f}</lc>ms | "
+                    f"Taps: <lg>{totals.get('taps', 0):,}</lg> | "
+                    f"Coins: <lg>{totals.get('coins', 0):,}</lg> | "
+                    f"Requests per 1k coins: <lw>{requests_per_1k_coins:,.2f}</lw>")
+
+    def forward_signal(self, signum: int) -> None:
+        for process in self.processes.values():
+            if process.pid:
+                os.kill(process.pid, signum)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if hasattr(signal, 'SIGUSR1'):
+            loop.add_signal_handler(signal.SIGUSR1, self.forward_signal, signal.SIGUSR1)
+
+        for shard_index in range(self.workers):
+            self.start_shard(shard_index=shard_index)
+
+        logger.info(f"Started <lc>{self.workers}</lc> shards")
+
+        stats_logged_time = loop.time()
+
+        try:
+            while self.processes or self.restart_at:
+                await asyncio.sleep(.1)
+
+                self.drain_queue()
+
+                for shard_index, process in list(self.processes.items()):
+                    if process.is_alive():
+                        continue
+
+                    del self.processes[shard_index]
+                    self.drain_queue()
+                    self.retire_stats(shard_index=shard_index)
+
+                    if process.exitcode:
+                        logger.error(f"Shard {shard_index} crashed with exit code {process.exitcode}, "
+                                     f"restart in {RESTART_DELAY}s")
+                        self.restart_at[shard_index] = loop.time() + RESTART_DELAY
+
+                for shard_index, restart_at in list(self.restart_at.items()):
+                    if loop.time() >= restart_at:
+                        del self.restart_at[shard_index]
+                        self.start_shard(shard_index=shard_index)
+
+                if loop.time() - stats_logged_time >= STATS_INTERVAL:
+                    stats_logged_time = loop.time()
+                    self.log_stats()
+        finally:
+            for process in self.processes.values():
+                process.terminate()
+
+            for process in self.processes.values():
+                process.join()
+
+            self.drain_queue()
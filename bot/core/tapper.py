@@ -1,33 +1,85 @@
 import asyncio
+from enum import Enum
 from time import time
 from random import randint
-from datetime import datetime
+from typing import Callable
 from urllib.parse import unquote
 
-import aiohttp
-import aiocfscrape
-from aiohttp_proxy import ProxyConnector
 from better_proxy import Proxy
 from pyrogram import Client
-from pyrogram.errors import Unauthorized, UserDeactivated, AuthKeyUnregistered
+from pyrogram.errors import PeerIdInvalid, UserIdInvalid, BotInvalid, FloodWait
+from pyrogram.raw.types import InputPeerUser
 from pyrogram.raw.functions.messages import RequestWebView
 
 from bot.config import settings
+from bot.config.config import Settings
 from bot.utils import logger
-from bot.utils.graphql import Query, OperationName
+from bot.utils.graphql import OperationName
 from bot.utils.boosts import FreeBoostType, UpgradableBoostType
-from bot.utils.scripts import calculate_spin_multiplier
-from bot.exceptions import InvalidSession, InvalidProtocol
-from .TLS import TLSv1_3_BYPASS
-from .headers import headers
+from bot.utils.models import GameConfig, TapbotConfig, SlotMachineSpin
+from bot.utils.energy import EnergyModel
+from bot.utils.strategy import (choose_taps, choose_free_boost, get_sleep_between_taps, get_min_energy_sleep,
+                                get_sleep_after_taps)
+from bot.utils.upgrade_planner import UpgradePlan, plan_upgrade
+from bot.utils.session_store import session_store, get_token_expiry
+from bot.utils.stats import stats, get_requests_per_1k_coins
+from bot.utils.metrics import (taps_sent, coins_earned, accounts_energy, accounts_boss_level, account_energy,
+                               boss_level)
+from bot.utils.scripts import calculate_spin_multiplier, generate_tap_vector
+from bot.exceptions import InvalidSession, InvalidProtocol, InvalidAccessToken, RequestDeferred
+from .executor import GraphQLExecutor
+from .proxy_pool import ProxyPool
+from .profiler import profiler
+from .client_pool import client_pool
+from .refresh import refresh_coordinator, TOKEN_REFRESH_MARGIN
+
+
+BOT_USERNAME = 'memefi_coin_bot'
+
+UPGRADE_NAMES = {
+    UpgradableBoostType.TAP: 'tap',
+    UpgradableBoostType.ENERGY: 'energy',
+    UpgradableBoostType.CHARGE: 'charge',
+    UpgradableBoostType.TAPBOT: 'TapBot',
+}
+TAPBOT_RECHECK_INTERVAL = 3600
+FAILURE_DELAY = 3
+MAX_FAILURE_DELAY = 300
+
+
+class TapbotAction(str, Enum):
+    CLAIM = 'claim'
+    START = 'start'
 
 
 class Tapper:
-    def __init__(self, tg_client: Client):
+    def __init__(self, tg_client: Client, proxy_pool: ProxyPool | None = None, api: GraphQLExecutor | None = None,
+                 clock: Callable[[], float] = time, config: Settings = settings):
         self.session_name = tg_client.name
         self.tg_client = tg_client
-
-        self.GRAPHQL_URL = 'https://api-gw-tg.memefi.club/graphql'
+        self.proxy_pool = proxy_pool
+        self.proxy = proxy_pool.acquire() if proxy_pool else None
+
+        self.api = api or GraphQLExecutor(session_name=self.session_name, proxy=self.proxy)
+        self.clock = clock
+        self.config = config
+
+        self.access_token_refresh_at = 0
+        self.refresh_reserved = False
+        self.tg_web_data: dict | None = None
+        self.failures = 0
+        self.turbo_time = 0
+        self.active_turbo = False
+        self.pending_boost: FreeBoostType | None = None
+        self.pending_tapbot: TapbotAction | None = None
+        self.upgrade_plan: UpgradePlan | None = None
+        self.tapbot_config: TapbotConfig | None = None
+        self.tapbot_check_at = 0.
+
+        self.game_config: GameConfig | None = None
+        self.energy = EnergyModel()
+        self.balance = 0
+        self.coins_earned = 0
 
     async def get_tg_web_data(self, proxy: str | None):
         if proxy:
@@ -42,22 +94,10 @@ class Tapper:
         else:
             proxy_dict = None
 
-        self.tg_client.proxy = proxy_dict
-
         try:
-            if not self.tg_client.is_connected:
-                try:
-                    await self.tg_client.connect()
-                except (Unauthorized, UserDeactivated, AuthKeyUnregistered):
-                    raise InvalidSession(self.session_name)
-
-            web_view = await self.tg_client.invoke(RequestWebView(
-                peer=await self.tg_client.resolve_peer('memefi_coin_bot'),
-                bot=await self.tg_client.resolve_peer('memefi_coin_bot'),
-                platform='android',
-                from_bot_menu=False,
-                url='https://tg-app.memefi.club/game'
-            ))
+            await client_pool.acquire(tg_client=self.tg_client, proxy=proxy_dict)
+
+            web_view = await self.request_web_view()
 
             auth_url = web_view.url
             tg_web_data = unquote(
@@ -69,659 +109,559 @@ class Tapper:
             auth_date = tg_web_data.split('auth_date=', maxsplit=1)[1].split('&hash', maxsplit=1)[0]
             hash_ = tg_web_data.split('hash=', maxsplit=1)[1]
 
-            me = await self.tg_client.get_me()
-
-            json_data = {
-                'operationName': OperationName.MutationTelegramUserLogin,
-                'query': Query.MutationTelegramUserLogin,
-                'variables': {
-                    'webAppData': {
-                        'auth_date': int(auth_date),
-                        'hash': hash_,
-                        'query_id': query_id,
-                        'checkDataString': f'auth_date={auth_date}\nquery_id={query_id}\nuser={user_data}',
-                        'user': {
-                            'id': me.id,
-                            'allows_write_to_pm': True,
-                            'first_name': me.first_name,
-                            'last_name': me.last_name if me.last_name else '',
-                            'username': me.username if me.username else '',
-                            'language_code': me.language_code if me.language_code else 'en',
-                        },
-                    },
-                }
+            variables = {
+                'webAppData': {
+                    'auth_date': int(auth_date),
+                    'hash': hash_,
+                    'query_id': query_id,
+                    'checkDataString': f'auth_date={auth_date}\nquery_id={query_id}\nuser={user_data}',
+                    'user': await self.get_user_profile(),
+                },
             }
 
-            if self.tg_client.is_connected:
-                await self.tg_client.disconnect()
-
-            return json_data
+            return variables
 
-        except InvalidSession as error:
+        except (InvalidSession, FloodWait) as error:
             raise error
 
         except Exception as error:
             logger.error(f"{self.session_name} | ❗️ Unknown error during Authorization: {error}")
-            await asyncio.sleep(delay=3)
 
-    async def get_access_token(self, http_client: aiohttp.ClientSession, tg_web_data: dict[str]):
-        for _ in range(5):
-            try:
-                response = await http_client.post(url=self.GRAPHQL_URL, json=tg_web_data)
-                response.raise_for_status()
+        finally:
+            await client_pool.release(tg_client=self.tg_client)
 
-                response_json = await response.json()
+    async def get_bot_peer(self) -> InputPeerUser:
+        cached_peer = session_store.get_peer(session_name=self.session_name, username=BOT_USERNAME)
 
-                if 'errors' in response_json:
-                    raise InvalidProtocol(f'get_access_token msg: {response_json["errors"][0]["message"]}')
+        if cached_peer:
+            return InputPeerUser(user_id=cached_peer[0], access_hash=cached_peer[1])
 
-                access_token = response_json.get('data', {}).get('telegramUserLogin', {}).get('access_token', '')
+        peer = await self.tg_client.resolve_peer(BOT_USERNAME)
+        session_store.set_peer(session_name=self.session_name, username=BOT_USERNAME,
+                               user_id=peer.user_id, access_hash=peer.access_hash)
 
-                if not access_token:
-                    await asyncio.sleep(delay=3)
-                    continue
+        return peer
 
-                return access_token
-            except Exception as error:
-                logger.error(f"{self.session_name} | ❗️ Unknown error while getting Access Token: {error}")
-                await asyncio.sleep(delay=3)
+    async def request_web_view(self):
+        for attempt in range(2):
+            peer = await self.get_bot_peer()
 
-        return ""
+            try:
+                return await self.tg_client.invoke(RequestWebView(
+                    peer=peer,
+                    bot=peer,
+                    platform='android',
+                    from_bot_menu=False,
+                    url='https://tg-app.memefi.club/game'
+                ))
+            except (PeerIdInvalid, UserIdInvalid, BotInvalid):
+                session_store.delete_peer(session_name=self.session_name, username=BOT_USERNAME)
 
-    async def get_telegram_me(self, http_client: aiohttp.ClientSession):
-        try:
-            json_data = {
-                'operationName': OperationName.QueryTelegramUserMe,
-                'query': Query.QueryTelegramUserMe,
-                'variables': {}
-            }
+                if attempt:
+                    raise
+
+    async def get_user_profile(self) -> dict:
+        profile = session_store.get_profile(session_name=self.session_name)
+
+        if profile:
+            return profile
 
-            response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-            response.raise_for_status()
+        me = await self.tg_client.get_me()
+        profile = {
+            'id': me.id,
+            'allows_write_to_pm': True,
+            'first_name': me.first_name,
+            'last_name': me.last_name if me.last_name else '',
+            'username': me.username if me.username else '',
+            'language_code': me.language_code if me.language_code else 'en',
+        }
+        session_store.set_profile(session_name=self.session_name, profile=profile)
 
-            response_json = await response.json()
+        return profile
 
-            if 'errors' in response_json:
-                raise InvalidProtocol(f'get_telegram_me msg: {response_json["errors"][0]["message"]}')
+    async def get_access_token(self, tg_web_data: dict[str]):
+        return await self.api.execute(operation_name=OperationName.MutationTelegramUserLogin,
+                                      variables=tg_web_data,
+                                      path=('telegramUserLogin', 'access_token'),
+                                      default='')
 
-            me = response_json['data']['telegramUserMe']
+    async def get_telegram_me(self):
+        return await self.api.execute(operation_name=OperationName.QueryTelegramUserMe,
+                                      path='telegramUserMe',
+                                      default={})
 
-            return me
-        except Exception as error:
-            logger.error(f"{self.session_name} | ❗️ Unknown error while getting Telegram Me: {error}")
-            await asyncio.sleep(delay=3)
+    async def get_profile_data(self) -> GameConfig | None:
+        profile_data = await self.api.execute(operation_name=OperationName.QUERY_GAME_CONFIG,
+                                              path='telegramGameGetConfig')
 
-            return {}
+        return GameConfig.from_dict(profile_data) if profile_data else None
 
-    async def get_profile_data(self, http_client: aiohttp.ClientSession):
-        for _ in range(5):
-            try:
-                json_data = {
-                    'operationName': OperationName.QUERY_GAME_CONFIG,
-                    'query': Query.QUERY_GAME_CONFIG,
-                    'variables': {}
-                }
+    async def get_bot_config(self) -> TapbotConfig | None:
+        bot_config = await self.api.execute(operation_name=OperationName.TapbotConfig,
+                                            path='telegramGameTapbotGetConfig')
 
-                response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-                response.raise_for_status()
+        return TapbotConfig.from_dict(bot_config) if bot_config else None
 
-                response_json = await response.json()
+    async def start_bot(self) -> TapbotConfig | None:
+        start_data = await self.api.execute(operation_name=OperationName.TapbotStart,
+                                            path='telegramGameTapbotStart')
 
-                if 'errors' in response_json:
-                    raise InvalidProtocol(f'get_profile_data msg: {response_json["errors"][0]["message"]}')
+        return TapbotConfig.from_dict(start_data) if start_data else None
 
-                profile_data = response_json.get('data', {}).get('telegramGameGetConfig', {})
+    async def claim_bot(self) -> TapbotConfig | None:
+        claim_data = await self.api.execute(operation_name=OperationName.TapbotClaim,
+                                            path='telegramGameTapbotClaimCoins')
 
-                if not profile_data:
-                    await asyncio.sleep(delay=3)
-                    continue
+        return TapbotConfig.from_dict(claim_data) if claim_data else None
 
-                return profile_data
-            except Exception as error:
-                logger.error(f"{self.session_name} | ❗️ Unknown error while getting Profile Data: {error}")
-                await asyncio.sleep(delay=3)
+    async def set_next_boss(self) -> GameConfig | None:
+        boss_data = await self.api.execute(operation_name=OperationName.telegramGameSetNextBoss,
+                                           path='telegramGameSetNextBoss')
 
-        return {}
+        return GameConfig.from_dict(boss_data) if boss_data else None
 
-    async def get_bot_config(self, http_client: aiohttp.ClientSession):
-        for _ in range(5):
-            try:
-                json_data = {
-                    'operationName': OperationName.TapbotConfig,
-                    'query': Query.TapbotConfig,
-                    'variables': {}
-                }
+    async def apply_boost(self, boost_type: FreeBoostType) -> GameConfig | None:
+        boost_data = await self.api.execute(operation_name=OperationName.telegramGameActivateBooster,
+                                            variables={'boosterType': boost_type},
+                                            path='telegramGameActivateBooster')
 
-                response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-                response.raise_for_status()
+        return GameConfig.from_dict(boost_data) if boost_data else None
 
-                response_json = await response.json()
+    async def play_slotmachine(self, spin_multiplier: int) -> SlotMachineSpin | None:
+        play_data = await self.api.execute(operation_name=OperationName.SpinSlotMachine,
+                                           variables={'payload': {'spinsCount': spin_multiplier}},
+                                           path='slotMachineSpinV2')
 
-                if 'errors' in response_json:
-                    raise InvalidProtocol(f'get_bot_config msg: {response_json["errors"][0]["message"]}')
+        return SlotMachineSpin.from_dict(play_data) if play_data else None
 
-                bot_config = response_json.get('data', {}).get('telegramGameTapbotGetConfig', {})
+    async def upgrade_boost(self, boost_type: UpgradableBoostType) -> GameConfig | None:
+        upgrade_data = await self.api.execute(operation_name=OperationName.telegramGamePurchaseUpgrade,
+                                              variables={'upgradeType': boost_type},
+                                              path='telegramGamePurchaseUpgrade')
 
-                if not bot_config:
-                    await asyncio.sleep(delay=3)
-                    continue
+        return GameConfig.from_dict(upgrade_data) if upgrade_data else None
 
-                return bot_config
-            except Exception as error:
-                logger.error(f"{self.session_name} | ❗️ Unknown error while getting TapBot Data: {error}")
-                await asyncio.sleep(delay=3)
+    async def send_taps(self, nonce: str, taps: int, zones: int) -> GameConfig | None:
+        with profiler.span(name='tap_vector'):
+            vector = generate_tap_vector(taps=taps, zones=zones)
 
-        return {}
+        profile_data = await self.api.execute(operation_name=OperationName.MutationGameProcessTapsBatch,
+                                              variables={
+                                                  'payload': {
+                                                      'nonce': nonce,
+                                                      'tapsCount': taps,
+                                                      'vector': vector,
+                                                  },
+                                              },
+                                              path='telegramGameProcessTapsBatch')
 
-    async def start_bot(self, http_client: aiohttp.ClientSession):
-        for _ in range(5):
-            try:
-                json_data = {
-                    'operationName': OperationName.TapbotStart,
-                    'query': Query.TapbotStart,
-                    'variables': {}
-                }
+        return GameConfig.from_dict(profile_data) if profile_data else None
 
-                response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-                response.raise_for_status()
+    def queue_tapbot_start(self, bot_config: TapbotConfig) -> float | None:
+        if bot_config.used_attempts < bot_config.total_attempts:
+            logger.info(f"{self.session_name} | Sleep <lw>5s</lw> before start the TapBot")
+            self.pending_tapbot = TapbotAction.START
 
-                response_json = await response.json()
+            return 5
 
-                if 'errors' in response_json:
-                    raise InvalidProtocol(f'start_bot msg: {response_json["errors"][0]["message"]}')
+        logger.info(f"{self.session_name} | TapBot attempts are spent | "
+                    f"<ly>{bot_config.used_attempts}</ly><lw>/</lw><le>{bot_config.total_attempts}</le>")
+        self.tapbot_check_at = self.clock() + TAPBOT_RECHECK_INTERVAL
 
-                start_data = response_json['data']['telegramGameTapbotStart']
+        return None
 
-                if not start_data:
-                    await asyncio.sleep(delay=3)
-                    continue
+    async def process_tapbot(self) -> float | None:
+        bot_config = await self.get_bot_config()
+        if not bot_config:
+            return None
 
-                return start_data
-            except Exception as error:
-                logger.error(f"{self.session_name} | ❗️ Unknown error while Starting Bot: {error}")
-                await asyncio.sleep(delay=3)
+        self.tapbot_config = bot_config
 
-        return None
+        if not bot_config.is_purchased:
+            self.tapbot_check_at = float('inf')
+            return None
 
-    async def claim_bot(self, http_client: aiohttp.ClientSession):
-        for _ in range(5):
-            try:
-                json_data = {
-                    'operationName': OperationName.TapbotClaim,
-                    'query': Query.TapbotClaim,
-                    'variables': {}
-                }
+        if bot_config.ends_at:
+            ends_at_date = bot_config.ends_at_date
 
-                response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-                response.raise_for_status()
+            if ends_at_date.timestamp() > self.clock():
+                logger.info(f"{self.session_name} | TapBot ends at: "
+                            f"<ly>{ends_at_date.strftime('%d.%m.%Y %H:%M:%S')}</ly>")
+                self.tapbot_check_at = ends_at_date.timestamp()
+                return None
 
-                response_json = await response.json()
+            logger.info(f"{self.session_name} | Sleep <lw>5s</lw> before claim TapBot")
+            self.pending_tapbot = TapbotAction.CLAIM
 
-                if 'errors' in response_json:
-                    raise InvalidProtocol(f'claim_bot msg: {response_json["errors"][0]["message"]}')
+            return 5
 
-                claim_data = response_json.get('data', {}).get('telegramGameTapbotClaimCoins', {})
+        return self.queue_tapbot_start(bot_config=bot_config)
 
-                if not claim_data:
-                    await asyncio.sleep(delay=3)
-                    continue
+    async def process_pending_tapbot(self) -> float:
+        if self.pending_tapbot == TapbotAction.CLAIM:
+            claim_data = await self.claim_bot()
+            self.pending_tapbot = None
+            if not claim_data:
+                return self.get_failure_delay()
 
-                return claim_data
-            except Exception as error:
-                logger.error(f"{self.session_name} | ❗️ Unknown error while Claiming Bot: {error}")
-                await asyncio.sleep(delay=3)
+            logger.success(f"{self.session_name} | Successfully claimed TapBot")
+            self.tapbot_config = claim_data
 
-        return {}
+            return self.queue_tapbot_start(bot_config=claim_data) or 1
 
-    async def set_next_boss(self, http_client: aiohttp.ClientSession):
-        try:
-            json_data = {
-                'operationName': OperationName.telegramGameSetNextBoss,
-                'query': Query.telegramGameSetNextBoss,
-                'variables': {}
-            }
+        start_data = await self.start_bot()
+        self.pending_tapbot = None
 
-            response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-            response.raise_for_status()
+        if start_data and start_data.ends_at:
+            self.tapbot_check_at = start_data.ends_at_date.timestamp()
+        else:
+            self.tapbot_check_at = self.clock() + TAPBOT_RECHECK_INTERVAL
 
-            response_json = await response.json()
+        if not start_data:
+            return self.get_failure_delay()
 
-            return True
-        except Exception as error:
-            logger.error(f"{self.session_name} | ❗️ Unknown error while Setting Next Boss: {error}")
-            await asyncio.sleep(delay=3)
+        logger.success(f"{self.session_name} | Successfully started TapBot | "
+                       f"Damage per second: <le>{start_data.damage_per_sec}</le> points")
+        self.tapbot_config = start_data
+
+        return 1
 
+    async def purchase_upgrade(self) -> bool:
+        upgrade_plan = plan_upgrade(game_config=self.game_config, tapbot_config=self.tapbot_config,
+                                    config=self.config)
+
+        if upgrade_plan != self.upgrade_plan:
+            self.upgrade_plan = upgrade_plan
+
+            if upgrade_plan:
+                logger.info(f"{self.session_name} | Next upgrade: "
+                            f"<lm>{UPGRADE_NAMES[upgrade_plan.boost_type]}</lm> {upgrade_plan.level} lvl "
+                            f"at <le>{upgrade_plan.price:,}</le> coins | "
+                            f"Payback: <lw>{upgrade_plan.payback_hours:,.1f}</lw>h")
+
+        if upgrade_plan is None or self.balance < upgrade_plan.price:
             return False
 
-    async def apply_boost(self, http_client: aiohttp.ClientSession, boost_type: FreeBoostType):
-        try:
-            json_data = {
-                'operationName': OperationName.telegramGameActivateBooster,
-                'query': Query.telegramGameActivateBooster,
-                'variables': {
-                    'boosterType': boost_type
-                }
-            }
+        game_config = await self.upgrade_boost(boost_type=upgrade_plan.boost_type)
+        if not game_config:
+            return False
 
-            response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-            response.raise_for_status()
+        self.set_game_config(game_config=game_config, learn=False)
+        self.balance = game_config.coins_amount
 
-            response_json = await response.json()
+        if upgrade_plan.boost_type == UpgradableBoostType.TAPBOT:
+            logger.success(f"{self.session_name} | Successfully purchased TapBot")
 
-            if 'errors' in response_json:
-                raise InvalidProtocol(f'apply_boost msg: {response_json["errors"][0]["message"]}')
+            self.tapbot_config = None
+            self.tapbot_check_at = 0
+        else:
+            logger.success(f"{self.session_name} | "
+                           f"{UPGRADE_NAMES[upgrade_plan.boost_type].capitalize()} upgraded to "
+                           f"<lm>{upgrade_plan.level}</lm> lvl")
 
-            return True
-        except Exception as error:
-            logger.error(f"{self.session_name} | ❗️ Unknown error while Apply {boost_type} Boost: {error}")
-            await asyncio.sleep(delay=3)
+        return True
 
-            return False
+    def check_proxy(self) -> None:
+        proxy = self.proxy_pool.reassign(proxy=self.proxy)
 
-    async def play_slotmachine(self, http_client: aiohttp.ClientSession, spin_multiplier: int):
-        try:
-            json_data = {
-                'operationName': OperationName.SpinSlotMachine,
-                'query': Query.SpinSlotMachine,
-                'variables': {'payload': {'spinsCount': spin_multiplier}}
-            }
+        if proxy != self.proxy:
+            logger.warning(f"{self.session_name} | Proxy {self.proxy} degraded, switched to {proxy}")
+            self.proxy = self.api.proxy = proxy
+
+    def release(self) -> None:
+        if self.proxy_pool:
+            self.proxy_pool.release(proxy=self.proxy)
+
+        accounts_energy.remove(self.session_name)
+        accounts_boss_level.remove(self.session_name)
+        account_energy.remove(self.session_name)
+        boss_level.remove(self.session_name)
 
-            response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-            response.raise_for_status()
+    def set_game_config(self, game_config: GameConfig, spent_energy: int = 0, learn: bool = True) -> None:
+        self.game_config = game_config
+        self.failures = 0
+        self.energy.observe(energy=game_config.current_energy,
+                            max_energy=game_config.max_energy,
+                            recharge_level=game_config.energy_recharge_level,
+                            spent=spent_energy,
+                            now=self.clock(),
+                            learn=learn)
 
-            response_json = await response.json()
+        accounts_energy.set(self.session_name, value=game_config.current_energy)
+        accounts_boss_level.set(self.session_name, value=game_config.current_boss.level)
 
-            play_data = response_json.get('data', {}).get('slotMachineSpinV2', {})
+        if self.config.METRICS_PER_SESSION is True:
+            account_energy.set(self.session_name, value=game_config.current_energy)
+            boss_level.set(self.session_name, value=game_config.current_boss.level)
 
-            return play_data
-        except Exception:
-            return {}
+    def get_failure_delay(self) -> float:
+        self.failures += 1
+        delay = min(FAILURE_DELAY * 2 ** (self.failures - 1), MAX_FAILURE_DELAY)
 
-    async def upgrade_boost(self, http_client: aiohttp.ClientSession, boost_type: UpgradableBoostType):
+        logger.info(f"{self.session_name} | Request failed, retry in <lw>{delay:,.0f}s</lw>")
+
+        return delay
+
+    async def step(self) -> float | None:
         try:
-            json_data = {
-                'operationName': OperationName.telegramGamePurchaseUpgrade,
-                'query': Query.telegramGamePurchaseUpgrade,
-                'variables': {
-                    'upgradeType': boost_type
-                }
-            }
+            with profiler.span(name='step'):
+                return await self.process_step()
 
-            response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-            response.raise_for_status()
+        except RequestDeferred as error:
+            return error.delay
 
-            response_json = await response.json()
+        except InvalidProtocol as error:
+            if self.config.EMERGENCY_STOP is True:
+                raise error
 
-            if 'errors' in response_json:
-                raise InvalidProtocol(f'upgrade_boost msg: {response_json["errors"][0]["message"]}')
+            logger.error(f"{self.session_name} | ⚠ Warning! Invalid protocol detected in {error}")
+            return randint(a=3, b=7)
 
-            return True
-        except Exception:
-            return False
+        except InvalidAccessToken as error:
+            logger.warning(f"{self.session_name} | Access token rejected in {error}, re-authorizing")
+            session_store.delete_access_token(session_name=self.session_name)
+            self.access_token_refresh_at = 0
+            return 0
 
-    async def send_taps(self, http_client: aiohttp.ClientSession, nonce: str, taps: int):
-        for _ in range(5):
-            try:
-                vector = []
+        except FloodWait as error:
+            delay = error.value + randint(a=5, b=30)
+            logger.warning(f"{self.session_name} | FloodWait during Authorization, retry in {delay}s")
+            return delay
+
+        except InvalidSession as error:
+            raise error
 
-                for _ in range(taps):
-                    vector.append(str(randint(1, 4)))
+        except Exception as error:
+            logger.error(f"{self.session_name} | ❗️ Unknown error: {error}")
+            return 3
 
-                vector = ','.join(vector)
+    async def process_step(self) -> float | None:
+        if self.proxy_pool:
+            self.check_proxy()
 
-                json_data = {
-                    'operationName': OperationName.MutationGameProcessTapsBatch,
-                    'query': Query.MutationGameProcessTapsBatch,
-                    'variables': {
-                        'payload': {
-                            'nonce': nonce,
-                            'tapsCount': taps,
-                            'vector': vector,
-                        },
-                    }
-                }
+        if self.clock() >= self.access_token_refresh_at:
+            cached_token = None if self.access_token_refresh_at else session_store.get_access_token(
+                session_name=self.session_name)
+            access_token, expires_at = cached_token or ('', 0)
 
-                response = await http_client.post(url=self.GRAPHQL_URL, json=json_data)
-                response.raise_for_status()
+            if expires_at - TOKEN_REFRESH_MARGIN > self.clock():
+                logger.info(f"{self.session_name} | Using cached access token")
+            else:
+                if not self.refresh_reserved and self.tg_web_data is None:
+                    delay = refresh_coordinator.reserve()
 
-                response_json = await response.json()
+                    if delay > 0:
+                        self.refresh_reserved = True
+                        return delay
 
-                if 'errors' in response_json:
-                    raise InvalidProtocol(f'send_taps msg: {response_json["errors"][0]["message"]}')
+                self.refresh_reserved = False
+                self.api.headers.pop("Authorization", None)
 
-                profile_data = response_json.get('data', {}).get('telegramGameProcessTapsBatch', {})
+                if self.tg_web_data is None:
+                    async with refresh_coordinator.semaphore:
+                        tg_web_data = await self.get_tg_web_data(proxy=self.proxy)
 
-                if not profile_data:
-                    await asyncio.sleep(delay=3)
-                    continue
+                    if not tg_web_data:
+                        logger.info(f"{self.session_name} | Log out!")
+                        return None
 
-                return profile_data
-            except Exception as error:
-                logger.error(f"{self.session_name} | ❗️ Unknown error when Tapping: {error}")
-                await asyncio.sleep(delay=3)
+                    self.tg_web_data = tg_web_data
 
-        return {}
+                access_token = await self.get_access_token(tg_web_data=self.tg_web_data)
+                self.tg_web_data = None
 
-    async def start_tapbot(self, http_client: aiohttp.ClientSession, bot_config: dict):
-        used_attempts = bot_config.get('usedAttempts', 0)
-        total_attempts = bot_config.get('totalAttempts', 0)
+                if not access_token:
+                    session_store.delete_profile(session_name=self.session_name)
+                    return self.get_failure_delay()
 
-        if used_attempts < total_attempts:
-            logger.info(f"{self.session_name} | Sleep 5s before start the TapBot")
-            await asyncio.sleep(5)
+                expires_at = get_token_expiry(access_token=access_token) or self.clock() + 5400
+                session_store.set_access_token(session_name=self.session_name,
+                                               access_token=access_token,
+                                               expires_at=expires_at)
 
-            start_data = await self.start_bot(http_client=http_client)
-            if start_data:
-                damage_per_sec = start_data.get('damagePerSec', 0)
-                logger.success(f"{self.session_name} | Successfully started TapBot | "
-                               f"Damage per second: <le>{damage_per_sec}</le> points")
-        else:
-            logger.info(f"{self.session_name} | TapBot attempts are spent | "
-                        f"<ly>{used_attempts}</ly><lw>/</lw><le>{total_attempts}</le>")
+            self.api.headers["Authorization"] = f"Bearer {access_token}"
 
-    async def purchase_and_start_tapbot(self, http_client: aiohttp.ClientSession, bot_config: dict):
-        status = await self.upgrade_boost(http_client=http_client, boost_type=UpgradableBoostType.TAPBOT)
-        if status:
-            logger.success(f"{self.session_name} | Successfully purchased TapBot")
-            await asyncio.sleep(1)
-            await self.start_tapbot(http_client, bot_config)
+            self.access_token_refresh_at = refresh_coordinator.get_refresh_time(expires_at=expires_at,
+                                                                                now=self.clock())
 
-    async def check_proxy(self, http_client: aiohttp.ClientSession, proxy: Proxy) -> None:
-        try:
-            response = await http_client.get(url='https://api.ipify.org?format=json', timeout=aiohttp.ClientTimeout(5))
-            ip = (await response.json()).get('ip')
-            logger.info(f"{self.session_name} | Proxy IP: {ip}")
-        except Exception as error:
-            logger.error(f"{self.session_name} | Proxy: {proxy} | Error: {error}")
+            await self.get_telegram_me()
+
+            self.game_config = None
+
+        if self.game_config is None:
+            game_config = await self.get_profile_data()
+
+            if not game_config:
+                return self.get_failure_delay()
+
+            self.set_game_config(game_config=game_config)
+
+            self.balance = self.game_config.coins_amount
+            current_boss = self.game_config.current_boss
+
+            logger.info(f"{self.session_name} | Current boss level: <lm>{current_boss.level:,}</lm> | "
+                        f"Boss health: <lr>{current_boss.current_health:,}</lr>"
+                        f"<lw>/</lw><le>{current_boss.max_health:,}</le>")
+
+            return 1
 
-    async def run(self, proxy: str | None):
-        access_token_created_time = 0
-        ends_at_logged_time = 0
-        turbo_time = 0
-        active_turbo = False
+        if self.pending_boost is not None:
+            boost_type = self.pending_boost
 
-        ssl_context = TLSv1_3_BYPASS.create_ssl_context()
-        conn = ProxyConnector().from_url(url=proxy, rdns=True, ssl=ssl_context) if proxy \
-            else aiohttp.TCPConnector(ssl=ssl_context)
+            boost_config = await self.apply_boost(boost_type=boost_type)
+            self.pending_boost = None
+            if not boost_config:
+                return self.get_failure_delay()
 
-        async with aiocfscrape.CloudflareScraper(headers=headers, connector=conn) as http_client:
-            if proxy:
-                await self.check_proxy(http_client=http_client, proxy=proxy)
+            self.set_game_config(game_config=boost_config, learn=False)
 
-            while True:
-                try:
-                    if time() - access_token_created_time >= 5400:
-                        http_client.headers.pop("Authorization", None)
+            if boost_type == FreeBoostType.TURBO:
+                logger.success(f"{self.session_name} | Turbo boost applied")
 
-                        tg_web_data = await self.get_tg_web_data(proxy=proxy)
+                self.active_turbo = True
+                self.turbo_time = self.clock()
+            else:
+                logger.success(f"{self.session_name} | Energy boost applied")
 
-                        if not tg_web_data:
-                            logger.info(f"{self.session_name} | Log out!")
-                            return
+            return 1
 
-                        access_token = await self.get_access_token(http_client=http_client, tg_web_data=tg_web_data)
+        if self.pending_tapbot is not None:
+            return await self.process_pending_tapbot()
 
-                        if not access_token:
-                            await asyncio.sleep(delay=5)
-                            continue
+        game_config = self.game_config
 
-                        http_client.headers["Authorization"] = f"Bearer {access_token}"
+        if game_config.spin_energy_total > 0:
+            spins = game_config.spin_energy_total
+            spin_multiplier = calculate_spin_multiplier(spins=spins)
+            play_data = await self.play_slotmachine(spin_multiplier=spin_multiplier)
 
-                        access_token_created_time = time()
+            if not play_data:
+                game_config.spin_energy_total = 0
+                return 1
 
-                        await self.get_telegram_me(http_client=http_client)
+            self.set_game_config(game_config=play_data.game_config)
+            spins = self.game_config.spin_energy_total
+            self.balance = self.game_config.coins_amount
 
-                        profile_data = await self.get_profile_data(http_client=http_client)
+            logger.info(f"{self.session_name} | Successfully played in slot machine | "
+                        f"Balance: <lc>{self.balance:,}</lc> "
+                        f"(<lg>+{play_data.reward_amount:,}</lg> <lm>{play_data.reward_type}</lm>) | "
+                        f"Spins: <le>{spins:,}</le> (<lr>-{spin_multiplier:,}</lr>)")
 
-                        if not profile_data:
-                            continue
+            return 2
 
-                        balance = profile_data.get('coinsAmount', 0)
+        available_energy = self.energy.predict(now=self.clock())
 
-                        nonce = profile_data.get('nonce', '')
+        taps, need_energy, batches = choose_taps(energy=available_energy,
+                                                 game_config=game_config,
+                                                 active_turbo=self.active_turbo,
+                                                 config=self.config)
 
-                        current_boss = profile_data.get('currentBoss', {})
-                        current_boss_level = current_boss.get('level', 0)
-                        boss_max_health = current_boss.get('maxHealth', 0)
-                        boss_current_health = current_boss.get('currentHealth', 0)
+        if self.active_turbo and self.clock() - self.turbo_time > 10:
+            self.active_turbo = False
+            self.turbo_time = 0
 
-                        logger.info(f"{self.session_name} | Current boss level: <lm>{current_boss_level:,}</lm> | "
-                                    f"Boss health: <lr>{boss_current_health:,}</lr><lw>/</lw><le>{boss_max_health:,}</le>")
+        if need_energy > available_energy:
+            logger.warning(f"{self.session_name} | "
+                           f"Need more energy: <ly>{available_energy:,}</ly>"
+                           f"<lw>/</lw><le>{need_energy:,}</le> for <lg>{taps:,}</lg> taps")
 
-                        await asyncio.sleep(delay=.5)
+            sleep_time = self.energy.seconds_until(target=need_energy, now=self.clock())
+            if sleep_time == float('inf'):
+                sleep_time = randint(a=self.config.SLEEP_BETWEEN_TAP[0], b=self.config.SLEEP_BETWEEN_TAP[1])
 
-                    spins = profile_data.get('spinEnergyTotal', 0)
-                    while spins > 0:
-                        await asyncio.sleep(delay=1)
+            logger.info(f"{self.session_name} | Sleep <lw>{sleep_time:,.0f}</lw>s")
 
-                        spin_multiplier = calculate_spin_multiplier(spins=spins)
-                        play_data = await self.play_slotmachine(http_client=http_client,
-                                                                spin_multiplier=spin_multiplier)
+            return max(sleep_time, 1)
 
-                        reward_amount = play_data.get('spinResults', [{}])[0].get('rewardAmount', 0)
-                        reward_type = play_data.get('spinResults', [{}])[0].get('rewardType', 'NO')
-                        spins = play_data.get('gameConfig', {}).get('spinEnergyTotal', 0)
-                        balance = play_data.get('gameConfig', {}).get('coinsAmount', 0)
+        tapped_config = await self.send_taps(nonce=game_config.nonce, taps=taps, zones=game_config.zones_count)
 
-                        logger.info(f"{self.session_name} | Successfully played in slot machine | "
-                                    f"Balance: <lc>{balance:,}</lc> (<lg>+{reward_amount:,}</lg> <lm>{reward_type}</lm>) | "
-                                    f"Spins: <le>{spins:,}</le> (<lr>-{spin_multiplier:,}</lr>)")
+        if not tapped_config:
+            return self.get_failure_delay()
 
-                        await asyncio.sleep(delay=1)
+        self.set_game_config(game_config=tapped_config, spent_energy=need_energy)
+        game_config = tapped_config
 
-                    taps = randint(a=settings.RANDOM_TAPS_COUNT[0], b=settings.RANDOM_TAPS_COUNT[1])
+        available_energy = game_config.current_energy
+        calc_taps = game_config.coins_amount - self.balance
+        self.balance = balance = game_config.coins_amount
+        self.coins_earned += max(calc_taps, 0)
 
-                    available_energy = profile_data.get('currentEnergy', 0)
-                    need_energy = taps * profile_data.get('weaponLevel', 0)
+        stats.increment(name='taps', value=taps)
+        stats.increment(name='coins', value=max(calc_taps, 0))
+        taps_sent.inc(value=taps)
+        coins_earned.inc(value=max(calc_taps, 0))
 
-                    if active_turbo:
-                        taps += settings.ADD_TAPS_ON_TURBO
-                        need_energy = 0
-                        if time() - turbo_time > 10:
-                            active_turbo = False
-                            turbo_time = 0
+        current_boss = game_config.current_boss
 
-                    if need_energy > available_energy:
-                        logger.warning(f"{self.session_name} | "
-                                       f"Need more energy: <ly>{available_energy:,}</ly>"
-                                       f"<lw>/</lw><le>{need_energy:,}</le> for <lg>{taps:,}</lg> taps")
+        if not self.config.LOG_TAPS_SUMMARY_INTERVAL:
+            requests_per_1k_coins = get_requests_per_1k_coins(requests=self.api.requests, coins=self.coins_earned)
+            logger.success(f"{self.session_name} | Successful tapped! | "
+                           f"Balance: <lc>{balance:,}</lc> (<lg>+{calc_taps}</lg>) | "
+                           f"Boss health: <lr>{current_boss.current_health:,}</lr> | "
+                           f"Energy: <ly>{available_energy:,}</ly> | "
+                           f"Requests per 1k coins: <lw>{requests_per_1k_coins:,.2f}</lw>")
 
-                        sleep_between_clicks = randint(a=settings.SLEEP_BETWEEN_TAP[0], b=settings.SLEEP_BETWEEN_TAP[1])
+        if current_boss.current_health <= 0:
+            logger.info(f"{self.session_name} | Setting next boss: <lm>{current_boss.level + 1}</lm> lvl")
 
-                        logger.info(f"Sleep <lw>{sleep_between_clicks:,}</lw>s")
-                        await asyncio.sleep(delay=sleep_between_clicks)
+            boss_config = await self.set_next_boss()
+            if not boss_config:
+                return self.get_failure_delay()
 
-                        profile_data = await self.get_profile_data(http_client=http_client)
+            self.set_game_config(game_config=boss_config)
 
-                        continue
+            logger.success(f"{self.session_name} | Successful setting next boss: "
+                           f"<lm>{current_boss.level + 1}</lm>")
 
-                    profile_data = await self.send_taps(http_client=http_client, nonce=nonce, taps=taps)
+            return 0
 
-                    if not profile_data:
-                        continue
+        sleep_between_taps = get_sleep_between_taps(active_turbo=self.active_turbo, config=self.config)
 
-                    available_energy = profile_data.get('currentEnergy', 0)
-                    new_balance = profile_data.get('coinsAmount', 0)
-                    calc_taps = new_balance - balance
-                    balance = new_balance
+        if self.active_turbo is False:
+            boost_type = choose_free_boost(game_config=game_config, energy=available_energy, config=self.config)
 
-                    free_boosts = profile_data.get('freeBoosts', {})
-                    turbo_boost_count = free_boosts.get('currentTurboAmount', 0)
-                    energy_boost_count = free_boosts.get('currentRefillEnergyAmount', 0)
+            if boost_type is not None:
+                boost_name = 'energy' if boost_type == FreeBoostType.ENERGY else 'turbo'
+                logger.info(f"{self.session_name} | Sleep <lw>5s</lw> before activating daily {boost_name} boost")
+                self.pending_boost = boost_type
 
-                    next_tap_level = profile_data.get('weaponLevel', 0) + 1
-                    next_energy_level = profile_data.get('energyLimitLevel', 0) + 1
-                    next_charge_level = profile_data.get('energyRechargeLevel', 0) + 1
+                return 5
 
-                    nonce = profile_data.get('nonce', '')
+            if self.config.USE_TAP_BOT is True and self.clock() >= self.tapbot_check_at:
+                delay = await self.process_tapbot()
 
-                    current_boss = profile_data.get('currentBoss', {})
-                    current_boss_level = current_boss.get('level', 0)
-                    boss_current_health = current_boss.get('currentHealth', 0)
+                if delay is not None:
+                    return delay
 
-                    logger.success(f"{self.session_name} | Successful tapped! | "
-                                   f"Balance: <lc>{balance:,}</lc> (<lg>+{calc_taps}</lg>) | "
-                                   f"Boss health: <lr>{boss_current_health:,}</lr> | "
-                                   f"Energy: <ly>{available_energy:,}</ly>")
+            if await self.purchase_upgrade():
+                return 1
 
-                    if boss_current_health <= 0:
-                        logger.info(f"{self.session_name} | Setting next boss: <lm>{current_boss_level + 1}</lm> lvl")
+            seconds_until_full = self.energy.seconds_until(target=game_config.max_energy, now=self.clock())
+            sleep_time = get_min_energy_sleep(energy=available_energy,
+                                              seconds_until_full=seconds_until_full,
+                                              sleep_between_taps=sleep_between_taps,
+                                              config=self.config)
 
-                        status = await self.set_next_boss(http_client=http_client)
-                        if status is True:
-                            logger.success(f"{self.session_name} | Successful setting next boss: "
-                                           f"<lm>{current_boss_level + 1}</lm>")
+            if sleep_time is not None:
+                logger.info(f"{self.session_name} | Minimum energy reached: <ly>{available_energy:,}</ly>")
+                logger.info(f"{self.session_name} | Sleep <lw>{sleep_time:,.0f}s</lw>")
 
-                        continue
+                return sleep_time
 
-                    if active_turbo is False:
-                        if (energy_boost_count > 0
-                                and available_energy < settings.MIN_AVAILABLE_ENERGY
-                                and settings.APPLY_DAILY_ENERGY is True):
-                            logger.info(f"{self.session_name} | Sleep <lw>5s</lw> before activating daily energy boost")
-                            await asyncio.sleep(delay=5)
-
-                            status = await self.apply_boost(http_client=http_client, boost_type=FreeBoostType.ENERGY)
-                            if status is True:
-                                logger.success(f"{self.session_name} | Energy boost applied")
+        min_batch_energy = self.config.RANDOM_TAPS_COUNT[0] * game_config.weapon_level
+        seconds_until_min_batch = self.energy.seconds_until(target=min_batch_energy, now=self.clock())
+        sleep_between_clicks = get_sleep_after_taps(sleep_between_taps=sleep_between_taps,
+                                                    batches=batches,
+                                                    active_turbo=self.active_turbo,
+                                                    seconds_until_min_batch=seconds_until_min_batch,
+                                                    config=self.config)
 
-                                await asyncio.sleep(delay=1)
+        if not self.config.LOG_TAPS_SUMMARY_INTERVAL:
+            logger.info(f"{self.session_name} | Sleep {sleep_between_clicks:,.0f}s")
 
-                            continue
-
-                        if turbo_boost_count > 0 and settings.APPLY_DAILY_TURBO is True:
-                            logger.info(f"{self.session_name} | Sleep <lw>5s</lw> before activating daily turbo boost")
-                            await asyncio.sleep(delay=5)
-
-                            status = await self.apply_boost(http_client=http_client, boost_type=FreeBoostType.TURBO)
-                            if status is True:
-                                logger.success(f"{self.session_name} | Turbo boost applied")
-
-                                await asyncio.sleep(delay=1)
-
-                                active_turbo = True
-                                turbo_time = time()
-
-                            continue
-
-                        if settings.USE_TAP_BOT is True:
-                            bot_config = await self.get_bot_config(http_client=http_client)
-
-                            is_purchased = bot_config.get('isPurchased', False)
-                            ends_at = bot_config.get('endsAt', None)
-
-                            if not ends_at:
-                                if is_purchased:
-                                    await self.start_tapbot(http_client, bot_config)
-                                else:
-                                    await self.purchase_and_start_tapbot(http_client, bot_config)
-                            else:
-                                ends_at_date = datetime.strptime(ends_at, '%Y-%m-%dT%H:%M:%S.%f%z')
-                                custom_ends_at_date = ends_at_date.strftime('%d.%m.%Y %H:%M:%S')
-                                ends_at_timestamp = ends_at_date.timestamp()
+        return sleep_between_clicks
 
-                                if ends_at_logged_time <= time():
-                                    logger.info(f"{self.session_name} | TapBot ends at: <ly>{custom_ends_at_date}</ly>")
-                                    ends_at_logged_time = time() + 900
-
-                                if ends_at_timestamp < time():
-                                    logger.info(f"{self.session_name} | Sleep <lw>5s</lw> before claim TapBot")
-                                    await asyncio.sleep(5)
-
-                                    claim_data = await self.claim_bot(http_client=http_client)
-                                    if claim_data:
-                                        logger.success(f"{self.session_name} | Successfully claimed TapBot")
-                                        await self.start_tapbot(http_client, bot_config)
-                                elif not is_purchased:
-                                    await self.purchase_and_start_tapbot(http_client, bot_config)
-
-                        if settings.AUTO_UPGRADE_TAP is True and next_tap_level <= settings.MAX_TAP_LEVEL:
-                            need_balance = 1000 * (2 ** (next_tap_level - 1))
-
-                            if balance > need_balance:
-                                status = await self.upgrade_boost(http_client=http_client,
-                                                                  boost_type=UpgradableBoostType.TAP)
-                                if status is True:
-                                    logger.success(f"{self.session_name} | "
-                                                   f"Tap upgraded to <lm>{next_tap_level}</lm> lvl")
-
-                                    await asyncio.sleep(delay=1)
-                            else:
-                                logger.warning(f"{self.session_name} | "
-                                               f"Need more gold for upgrade tap to <lm>{next_tap_level}</lm> lvl "
-                                               f"(<lc>{balance}</lc><lw>/</lw><le>{need_balance}</le>)")
-
-                        if settings.AUTO_UPGRADE_ENERGY is True and next_energy_level <= settings.MAX_ENERGY_LEVEL:
-                            need_balance = 1000 * (2 ** (next_energy_level - 1))
-                            if balance > need_balance:
-                                status = await self.upgrade_boost(http_client=http_client,
-                                                                  boost_type=UpgradableBoostType.ENERGY)
-                                if status is True:
-                                    logger.success(f"{self.session_name} | "
-                                                   f"Energy upgraded to <lm>{next_energy_level}</lm> lvl")
-
-                                    await asyncio.sleep(delay=1)
-                            else:
-                                logger.warning(f"{self.session_name} | "
-                                               f"Need more gold for upgrade energy to <lm>{next_energy_level}</lm> lvl "
-                                               f"(<lc>{balance}</lc><lw>/</lw><le>{need_balance}</le>)")
-
-                        if settings.AUTO_UPGRADE_CHARGE is True and next_charge_level <= settings.MAX_CHARGE_LEVEL:
-                            need_balance = 1000 * (2 ** (next_charge_level - 1))
-
-                            if balance > need_balance:
-                                status = await self.upgrade_boost(http_client=http_client,
-                                                                  boost_type=UpgradableBoostType.CHARGE)
-                                if status is True:
-                                    logger.success(f"{self.session_name} | "
-                                                   f"Charge upgraded to <lm>{next_charge_level}</lm> lvl")
-
-                                    await asyncio.sleep(delay=1)
-                            else:
-                                logger.warning(f"{self.session_name} | "
-                                               f"Need more gold for upgrade charge to <lm>{next_energy_level}</lm> lvl "
-                                               f"(<lc>{balance}</lc><lw>/</lw><le>{need_balance}</le>)")
-
-                        if available_energy < settings.MIN_AVAILABLE_ENERGY:
-                            logger.info(f"{self.session_name} | Minimum energy reached: <ly>{available_energy:,}</ly>")
-
-                            if isinstance(settings.SLEEP_BY_MIN_ENERGY, list):
-                                sleep_time = randint(a=settings.SLEEP_BY_MIN_ENERGY[0],
-                                                     b=settings.SLEEP_BY_MIN_ENERGY[1])
-                            else:
-                                sleep_time = settings.SLEEP_BY_MIN_ENERGY
-
-                            logger.info(f"{self.session_name} | Sleep <lw>{sleep_time:,}s</lw>")
-                            await asyncio.sleep(delay=sleep_time)
-
-                except InvalidProtocol as error:
-                    if settings.EMERGENCY_STOP is True:
-                        raise error
-                    else:
-                        logger.error(f"{self.session_name} | ⚠ Warning! Invalid protocol detected in {error}")
-                        await asyncio.sleep(delay=randint(a=3, b=7))
-
-                except InvalidSession as error:
-                    raise error
-
-                except Exception as error:
-                    logger.error(f"{self.session_name} | ❗️ Unknown error: {error}")
-                    await asyncio.sleep(delay=3)
-
-                else:
-                    sleep_between_clicks = randint(a=settings.SLEEP_BETWEEN_TAP[0], b=settings.SLEEP_BETWEEN_TAP[1])
-
-                    if active_turbo is True:
-                        sleep_between_clicks = 4
-
-                    logger.info(f"Sleep {sleep_between_clicks}s")
-                    await asyncio.sleep(delay=sleep_between_clicks)
-
-
-async def run_tapper(tg_client: Client, proxy: str | None):
-    try:
-        await Tapper(tg_client=tg_client).run(proxy=proxy)
-    except InvalidProtocol as error:
-        logger.error(f"{tg_client.name} | Invalid protocol detected at {error}")
-    except InvalidSession:
-        logger.error(f"{tg_client.name} | Invalid Session")
+    async def run(self):
+        while (delay := await self.step()) is not None:
+            await asyncio.sleep(delay=delay)
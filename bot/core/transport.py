@@ -0,0 +1,136 @@
+import ssl
+import asyncio
+from math import ceil
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiohttp
+import aiocfscrape
+from yarl import URL
+from aiohttp_proxy import ProxyConnector
+
+from bot.config import settings
+from bot.utils.stats import stats
+from bot.utils.metrics import proxy_in_flight
+from bot.utils.rate_limit import TokenBucket
+from .TLS import TLSv1_3_BYPASS
+from .headers import headers
+
+
+_http_clients: dict[str | None, aiocfscrape.CloudflareScraper] = {}
+_limiters: dict[str | None, 'RequestLimiter'] = {}
+_limiter_shares = 1
+
+LIMITER_BUSY_DELAY = .2
+
+
+def get_proxy_label(proxy: str | None) -> str:
+    if not proxy:
+        return 'direct'
+
+    return str(URL(proxy).with_user(None))
+
+
+class RequestLimiter:
+    def __init__(self, concurrency: int, rate: float, label: str = 'direct'):
+        self.label = label
+        self.semaphore = asyncio.Semaphore(concurrency) if concurrency > 0 else None
+        self.bucket = TokenBucket(rate=rate, burst=concurrency) if rate > 0 else None
+
+        self.requests = 0
+        self.wait_time = 0.
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.wait_time / self.requests if self.requests else 0.
+
+    @property
+    def busy(self) -> bool:
+        return self.semaphore is not None and self.semaphore.locked()
+
+    def record_wait(self, delay: float) -> float:
+        self.wait_time += delay
+        stats.increment(name='queue_wait_ms', value=int(delay * 1000))
+
+        return delay
+
+    def reserve(self) -> float:
+        return self.record_wait(delay=self.bucket.reserve() if self.bucket else 0.)
+
+    def defer(self) -> float:
+        return self.record_wait(delay=LIMITER_BUSY_DELAY)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self.semaphore:
+            await self.semaphore.acquire()
+
+        try:
+            self.requests += 1
+            proxy_in_flight.inc(self.label)
+
+            try:
+                yield
+            finally:
+                proxy_in_flight.inc(self.label, value=-1)
+        finally:
+            if self.semaphore:
+                self.semaphore.release()
+
+
+@lru_cache(maxsize=None)
+def get_ssl_context() -> ssl.SSLContext:
+    return TLSv1_3_BYPASS.create_ssl_context()
+
+
+def create_connector(proxy: str | None) -> aiohttp.BaseConnector:
+    ssl_context = get_ssl_context()
+
+    if proxy:
+        return ProxyConnector().from_url(url=proxy, rdns=True, ssl=ssl_context, limit=0, keepalive_timeout=60)
+
+    return aiohttp.TCPConnector(ssl=ssl_context, limit=0, keepalive_timeout=60)
+
+
+def get_http_client(proxy: str | None) -> aiocfscrape.CloudflareScraper:
+    http_client = _http_clients.get(proxy)
+
+    if http_client is None or http_client.closed:
+        http_client = aiocfscrape.CloudflareScraper(headers=headers, connector=create_connector(proxy=proxy),
+                                                  cookie_jar=aiohttp.DummyCookieJar())
+        _http_clients[proxy] = http_client
+
+    return http_client
+
+
+def set_limiter_shares(shares: int) -> None:
+    global _limiter_shares
+
+    _limiter_shares = max(shares, 1)
+    _limiters.clear()
+
+
+def get_request_limiter(proxy: str | None) -> RequestLimiter:
+    limiter = _limiters.get(proxy)
+
+    if limiter is None:
+        if proxy:
+            limiter = RequestLimiter(concurrency=ceil(settings.PROXY_MAX_CONCURRENT_REQUESTS / _limiter_shares),
+                                     rate=settings.PROXY_REQUESTS_PER_SECOND / _limiter_shares,
+                                     label=get_proxy_label(proxy=proxy))
+        else:
+            limiter = RequestLimiter(concurrency=0, rate=0)
+
+        _limiters[proxy] = limiter
+
+    return limiter
+
+
+async def close_http_clients() -> None:
+    http_clients = list(_http_clients.values())
+    _http_clients.clear()
+
+    for http_client in http_clients:
+        if not http_client.closed:
+            await http_client.close()
@@ -4,3 +4,14 @@ class InvalidSession(BaseException):
 
 class InvalidProtocol(BaseException):
     ...
+
+
+class InvalidAccessToken(BaseException):
+    ...
+
+
+
+class RequestDeferred(BaseException):
+    def __init__(self, delay: float):
+        super().__init__(f'Request deferred for {delay:.1f}s')
+        self.delay = delay
@@ -0,0 +1,66 @@
+from math import ceil
+from time import time
+
+
+def get_recharge_rate(recharge_level: int) -> float:
+    return float(max(recharge_level, 1))
+
+
+class EnergyModel:
+    __slots__ = ('energy', 'max_energy', 'recharge_level', 'rate', 'observed_at', 'learned')
+
+    SMOOTHING = .3
+    MIN_ELAPSED = 5
+
+    def __init__(self):
+        self.energy = 0.
+        self.max_energy = 0
+        self.recharge_level = 0
+        self.rate = 0.
+        self.observed_at = 0.
+        self.learned = False
+
+    def observe(self, energy: int, max_energy: int, recharge_level: int, spent: int = 0,
+                now: float | None = None, learn: bool = True) -> None:
+        now = time() if now is None else now
+
+        if recharge_level != self.recharge_level:
+            self.rate = get_recharge_rate(recharge_level=recharge_level)
+            self.learned = False
+        elif self.observed_at and learn:
+            elapsed = now - self.observed_at
+            uncapped = self.energy + self.rate * elapsed
+
+            if elapsed >= self.MIN_ELAPSED and uncapped < self.max_energy and energy < max_energy:
+                observed_rate = (energy - self.energy + spent) / elapsed
+
+                if observed_rate > 0:
+                    if self.learned:
+                        self.rate += (observed_rate - self.rate) * self.SMOOTHING
+                    else:
+                        self.rate = observed_rate
+                        self.learned = True
+
+        self.energy = float(energy)
+        self.max_energy = max_energy
+        self.recharge_level = recharge_level
+        self.observed_at = now
+
+    def predict(self, now: float | None = None) -> int:
+        now = time() if now is None else now
+
+        return int(min(self.max_energy, self.energy + self.rate * (now - self.observed_at)))
+
+    def seconds_until(self, target: int, now: float | None = None) -> float:
+        now = time() if now is None else now
+
+        target = min(target, self.max_energy)
+        missing = target - self.predict(now=now)
+
+        if missing <= 0:
+            return 0.
+
+        if self.rate <= 0:
+            return float('inf')
+
+        return float(ceil(missing / self.rate))
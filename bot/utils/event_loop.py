@@ -0,0 +1,20 @@
+import asyncio
+
+from bot.utils import logger
+
+
+def install_event_loop(backend: str) -> str:
+    if backend not in ('auto', 'uvloop'):
+        return 'asyncio'
+
+    try:
+        import uvloop
+    except ImportError:
+        if backend == 'uvloop':
+            logger.warning("uvloop is not installed, falling back to the asyncio event loop")
+
+        return 'asyncio'
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    return 'uvloop'
@@ -1,18 +1,211 @@
 from enum import Enum
+from hashlib import sha256
+
+
+FragmentBossFightConfig = """fragment FragmentBossFightConfig on TelegramGameConfigOutput {
+  _id
+  coinsAmount
+  currentEnergy
+  maxEnergy
+  weaponLevel
+  zonesCount
+  tapsReward
+  energyLimitLevel
+  energyRechargeLevel
+  tapBotLevel
+  currentBoss {
+    _id
+    level
+    currentHealth
+    maxHealth
+    __typename
+  }
+  freeBoosts {
+    _id
+    currentTurboAmount
+    maxTurboAmount
+    turboLastActivatedAt
+    turboAmountLastRechargeDate
+    currentRefillEnergyAmount
+    maxRefillEnergyAmount
+    refillEnergyLastActivatedAt
+    refillEnergyAmountLastRechargeDate
+    __typename
+  }
+  bonusLeaderDamageEndAt
+  bonusLeaderDamageStartAt
+  bonusLeaderDamageMultiplier
+  nonce
+  spinEnergyNextRechargeAt
+  spinEnergyNonRefillable
+  spinEnergyRefillable
+  spinEnergyTotal
+  spinEnergyStaticLimit
+  __typename
+}"""
+
+FragmentTapBotConfig = """fragment FragmentTapBotConfig on TelegramGameTapbotOutput {
+  damagePerSec
+  endsAt
+  id
+  isPurchased
+  startsAt
+  totalAttempts
+  usedAttempts
+  __typename
+}"""
+
+
+def compose(operation: str, *fragments: str) -> str:
+    return '\n\n'.join((operation, *fragments))
 
 
 class Query(str, Enum):
-    QUERY_GAME_CONFIG = "query QUERY_GAME_CONFIG {\n  telegramGameGetConfig {\n    ...FragmentBossFightConfig\n    __typename\n  }\n}\n\nfragment FragmentBossFightConfig on TelegramGameConfigOutput {\n  _id\n  coinsAmount\n  currentEnergy\n  maxEnergy\n  weaponLevel\n  zonesCount\n  tapsReward\n  energyLimitLevel\n  energyRechargeLevel\n  tapBotLevel\n  currentBoss {\n    _id\n    level\n    currentHealth\n    maxHealth\n    __typename\n  }\n  freeBoosts {\n    _id\n    currentTurboAmount\n    maxTurboAmount\n    turboLastActivatedAt\n    turboAmountLastRechargeDate\n    currentRefillEnergyAmount\n    maxRefillEnergyAmount\n    refillEnergyLastActivatedAt\n    refillEnergyAmountLastRechargeDate\n    __typename\n  }\n  bonusLeaderDamageEndAt\n  bonusLeaderDamageStartAt\n  bonusLeaderDamageMultiplier\n  nonce\n  spinEnergyNextRechargeAt\n  spinEnergyNonRefillable\n  spinEnergyRefillable\n  spinEnergyTotal\n  spinEnergyStaticLimit\n  __typename\n}"
-    QueryTelegramUserMe = "query QueryTelegramUserMe {\n  telegramUserMe {\n    firstName\n    lastName\n    telegramId\n    username\n    referralCode\n    isDailyRewardClaimed\n    referral {\n      username\n      lastName\n      firstName\n      bossLevel\n      coinsAmount\n      __typename\n    }\n    isReferralInitialJoinBonusAvailable\n    league\n    leagueIsOverTop10k\n    leaguePosition\n    _id\n    opens {\n      isAvailable\n      openType\n      __typename\n    }\n    features\n    role\n    earlyAdopterBonusAmount\n    earlyAdopterBonusPercentage\n    isFreeDurovDonated\n    __typename\n  }\n}"
-    MutationTelegramUserLogin = "mutation MutationTelegramUserLogin($webAppData: TelegramWebAppDataInput!) {\n  telegramUserLogin(webAppData: $webAppData) {\n    access_token\n    __typename\n  }\n}"
-    MutationGameProcessTapsBatch = "mutation MutationGameProcessTapsBatch($payload: TelegramGameTapsBatchInput!) {\n  telegramGameProcessTapsBatch(payload: $payload) {\n    ...FragmentBossFightConfig\n    __typename\n  }\n}\n\nfragment FragmentBossFightConfig on TelegramGameConfigOutput {\n  _id\n  coinsAmount\n  currentEnergy\n  maxEnergy\n  weaponLevel\n  zonesCount\n  tapsReward\n  energyLimitLevel\n  energyRechargeLevel\n  tapBotLevel\n  currentBoss {\n    _id\n    level\n    currentHealth\n    maxHealth\n    __typename\n  }\n  freeBoosts {\n    _id\n    currentTurboAmount\n    maxTurboAmount\n    turboLastActivatedAt\n    turboAmountLastRechargeDate\n    currentRefillEnergyAmount\n    maxRefillEnergyAmount\n    refillEnergyLastActivatedAt\n    refillEnergyAmountLastRechargeDate\n    __typename\n  }\n  bonusLeaderDamageEndAt\n  bonusLeaderDamageStartAt\n  bonusLeaderDamageMultiplier\n  nonce\n  __typename\n}"
-    telegramGameSetNextBoss = "mutation telegramGameSetNextBoss {\n  telegramGameSetNextBoss {\n    ...FragmentBossFightConfig\n    __typename\n  }\n}\n\nfragment FragmentBossFightConfig on TelegramGameConfigOutput {\n  _id\n  coinsAmount\n  currentEnergy\n  maxEnergy\n  weaponLevel\n  energyLimitLevel\n  energyRechargeLevel\n  tapBotLevel\n  currentBoss {\n    _id\n    level\n    currentHealth\n    maxHealth\n    __typename\n  }\n  freeBoosts {\n    _id\n    currentTurboAmount\n    maxTurboAmount\n    turboLastActivatedAt\n    turboAmountLastRechargeDate\n    currentRefillEnergyAmount\n    maxRefillEnergyAmount\n    refillEnergyLastActivatedAt\n    refillEnergyAmountLastRechargeDate\n    __typename\n  }\n  nonce\n  __typename\n}"
-    telegramGameActivateBooster = "mutation telegramGameActivateBooster($boosterType: BoosterType!) {\n  telegramGameActivateBooster(boosterType: $boosterType) {\n    ...FragmentBossFightConfig\n    __typename\n  }\n}\n\nfragment FragmentBossFightConfig on TelegramGameConfigOutput {\n  _id\n  coinsAmount\n  currentEnergy\n  maxEnergy\n  weaponLevel\n  zonesCount\n  tapsReward\n  energyLimitLevel\n  energyRechargeLevel\n  tapBotLevel\n  currentBoss {\n    _id\n    level\n    currentHealth\n    maxHealth\n    __typename\n  }\n  freeBoosts {\n    _id\n    currentTurboAmount\n    maxTurboAmount\n    turboLastActivatedAt\n    turboAmountLastRechargeDate\n    currentRefillEnergyAmount\n    maxRefillEnergyAmount\n    refillEnergyLastActivatedAt\n    refillEnergyAmountLastRechargeDate\n    __typename\n  }\n  bonusLeaderDamageEndAt\n  bonusLeaderDamageStartAt\n  bonusLeaderDamageMultiplier\n  nonce\n  __typename\n}"
-    telegramGamePurchaseUpgrade = "mutation telegramGamePurchaseUpgrade($upgradeType: UpgradeType!) {\n  telegramGamePurchaseUpgrade(type: $upgradeType) {\n    ...FragmentBossFightConfig\n    __typename\n  }\n}\n\nfragment FragmentBossFightConfig on TelegramGameConfigOutput {\n  _id\n  coinsAmount\n  currentEnergy\n  maxEnergy\n  weaponLevel\n  zonesCount\n  tapsReward\n  energyLimitLevel\n  energyRechargeLevel\n  tapBotLevel\n  currentBoss {\n    _id\n    level\n    currentHealth\n    maxHealth\n    __typename\n  }\n  freeBoosts {\n    _id\n    currentTurboAmount\n    maxTurboAmount\n    turboLastActivatedAt\n    turboAmountLastRechargeDate\n    currentRefillEnergyAmount\n    maxRefillEnergyAmount\n    refillEnergyLastActivatedAt\n    refillEnergyAmountLastRechargeDate\n    __typename\n  }\n  bonusLeaderDamageEndAt\n  bonusLeaderDamageStartAt\n  bonusLeaderDamageMultiplier\n  nonce\n  __typename\n}"
-    TapbotConfig = "fragment FragmentTapBotConfig on TelegramGameTapbotOutput {\n  damagePerSec\n  endsAt\n  id\n  isPurchased\n  startsAt\n  totalAttempts\n  usedAttempts\n  __typename\n}\n\nquery TapbotConfig {\n  telegramGameTapbotGetConfig {\n    ...FragmentTapBotConfig\n    __typename\n  }\n}"
-    TapbotStart = "fragment FragmentTapBotConfig on TelegramGameTapbotOutput {\n  damagePerSec\n  endsAt\n  id\n  isPurchased\n  startsAt\n  totalAttempts\n  usedAttempts\n  __typename\n}\n\nmutation TapbotStart {\n  telegramGameTapbotStart {\n    ...FragmentTapBotConfig\n    __typename\n  }\n}"
-    TapbotClaim = "fragment FragmentTapBotConfig on TelegramGameTapbotOutput {\n  damagePerSec\n  endsAt\n  id\n  isPurchased\n  startsAt\n  totalAttempts\n  usedAttempts\n  __typename\n}\n\nmutation TapbotClaim {\n  telegramGameTapbotClaimCoins {\n    ...FragmentTapBotConfig\n    __typename\n  }\n}"
-    SpinSlotMachine = "fragment FragmentBossFightConfig on TelegramGameConfigOutput {\n  _id\n  coinsAmount\n  currentEnergy\n  maxEnergy\n  weaponLevel\n  zonesCount\n  tapsReward\n  energyLimitLevel\n  energyRechargeLevel\n  tapBotLevel\n  currentBoss {\n    _id\n    level\n    currentHealth\n    maxHealth\n    __typename\n  }\n  freeBoosts {\n    _id\n    currentTurboAmount\n    maxTurboAmount\n    turboLastActivatedAt\n    turboAmountLastRechargeDate\n    currentRefillEnergyAmount\n    maxRefillEnergyAmount\n    refillEnergyLastActivatedAt\n    refillEnergyAmountLastRechargeDate\n    __typename\n  }\n  bonusLeaderDamageEndAt\n  bonusLeaderDamageStartAt\n  bonusLeaderDamageMultiplier\n  nonce\n  spinEnergyNextRechargeAt\n  spinEnergyNonRefillable\n  spinEnergyRefillable\n  spinEnergyTotal\n  spinEnergyStaticLimit\n  __typename\n}\n\nmutation spinSlotMachine($payload: SlotMachineSpinInput!) {\n  slotMachineSpinV2(payload: $payload) {\n    gameConfig {\n      ...FragmentBossFightConfig\n      __typename\n    }\n    spinResults {\n      id\n      combination\n      rewardAmount\n      rewardType\n      questItemsFromSpin\n      __typename\n    }\n    spinsProcessedCount\n    previousProgressBarConfig {\n      id\n      questItem\n      status\n      requiredQuestItems\n      collectedQuestItems\n      rewardType\n      rewardAmount\n      questEventEndsAt\n      questIndex\n      questLevel\n      __typename\n    }\n    nextProgressBarConfig {\n      id\n      questItem\n      status\n      requiredQuestItems\n      collectedQuestItems\n      rewardType\n      rewardAmount\n      questEventEndsAt\n      questIndex\n      questLevel\n      __typename\n    }\n    progressBarReward {\n      rewardType\n      rewardAmount\n      __typename\n    }\n    __typename\n  }\n}"
+    QUERY_GAME_CONFIG = compose("""query QUERY_GAME_CONFIG {
+  telegramGameGetConfig {
+    ...FragmentBossFightConfig
+    __typename
+  }
+}""", FragmentBossFightConfig)
+    QueryTelegramUserMe = compose("""query QueryTelegramUserMe {
+  telegramUserMe {
+    firstName
+    lastName
+    telegramId
+    username
+    referralCode
+    isDailyRewardClaimed
+    referral {
+      username
+      lastName
+      firstName
+      bossLevel
+      coinsAmount
+      __typename
+    }
+    isReferralInitialJoinBonusAvailable
+    league
+    leagueIsOverTop10k
+    leaguePosition
+    _id
+    opens {
+      isAvailable
+      openType
+      __typename
+    }
+    features
+    role
+    earlyAdopterBonusAmount
+    earlyAdopterBonusPercentage
+    isFreeDurovDonated
+    __typename
+  }
+}""")
+    MutationTelegramUserLogin = compose("""mutation MutationTelegramUserLogin($webAppData: TelegramWebAppDataInput!) {
+  telegramUserLogin(webAppData: $webAppData) {
+    access_token
+    __typename
+  }
+}""")
+    MutationGameProcessTapsBatch = compose("""mutation MutationGameProcessTapsBatch($payload: TelegramGameTapsBatchInput!) {
+  telegramGameProcessTapsBatch(payload: $payload) {
+    ...FragmentBossFightConfig
+    __typename
+  }
+}""", FragmentBossFightConfig)
+    telegramGameSetNextBoss = compose("""mutation telegramGameSetNextBoss {
+  telegramGameSetNextBoss {
+    ...FragmentBossFightConfig
+    __typename
+  }
+}""", FragmentBossFightConfig)
+    telegramGameActivateBooster = compose("""mutation telegramGameActivateBooster($boosterType: BoosterType!) {
+  telegramGameActivateBooster(boosterType: $boosterType) {
+    ...FragmentBossFightConfig
+    __typename
+  }
+}""", FragmentBossFightConfig)
+    telegramGamePurchaseUpgrade = compose("""mutation telegramGamePurchaseUpgrade($upgradeType: UpgradeType!) {
+  telegramGamePurchaseUpgrade(type: $upgradeType) {
+    ...FragmentBossFightConfig
+    __typename
+  }
+}""", FragmentBossFightConfig)
+    TapbotConfig = compose("""query TapbotConfig {
+  telegramGameTapbotGetConfig {
+    ...FragmentTapBotConfig
+    __typename
+  }
+}""", FragmentTapBotConfig)
+    TapbotStart = compose("""mutation TapbotStart {
+  telegramGameTapbotStart {
+    ...FragmentTapBotConfig
+    __typename
+  }
+}""", FragmentTapBotConfig)
+    TapbotClaim = compose("""mutation TapbotClaim {
+  telegramGameTapbotClaimCoins {
+    ...FragmentTapBotConfig
+    __typename
+  }
+}""", FragmentTapBotConfig)
+    SpinSlotMachine = compose("""mutation spinSlotMachine($payload: SlotMachineSpinInput!) {
+  slotMachineSpinV2(payload: $payload) {
+    gameConfig {
+      ...FragmentBossFightConfig
+      __typename
+    }
+    spinResults {
+      id
+      combination
+      rewardAmount
+      rewardType
+      questItemsFromSpin
+      __typename
+    }
+    spinsProcessedCount
+    previousProgressBarConfig {
+      id
+      questItem
+      status
+      requiredQuestItems
+      collectedQuestItems
+      rewardType
+      rewardAmount
+      questEventEndsAt
+      questIndex
+      questLevel
+      __typename
+    }
+    nextProgressBarConfig {
+      id
+      questItem
+      status
+      requiredQuestItems
+      collectedQuestItems
+      rewardType
+      rewardAmount
+      questEventEndsAt
+      questIndex
+      questLevel
+      __typename
+    }
+    progressBarReward {
+      rewardType
+      rewardAmount
+      __typename
+    }
+    __typename
+  }
+}""", FragmentBossFightConfig)
+
+    @property
+    def sha256_hash(self) -> str:
+        return QUERY_HASHES[self]
+
+
+QUERY_HASHES = {query: sha256(query.value.encode('utf-8')).hexdigest() for query in Query}
+
 
 class OperationName(str, Enum):
     QUERY_GAME_CONFIG = "QUERY_GAME_CONFIG"
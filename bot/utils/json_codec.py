@@ -0,0 +1,68 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if orjson is not None:
+    BACKEND = 'orjson'
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+
+elif msgspec is not None:
+    BACKEND = 'msgspec'
+
+    dumps = msgspec.json.Encoder().encode
+    loads = msgspec.json.Decoder().decode
+
+else:
+    BACKEND = 'json'
+
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    def dumps(obj: Any) -> bytes:
+        return _encoder.encode(obj).encode('utf-8')
+
+    loads = json.loads
+
+
+_request_prefixes: dict[tuple[str, str | None, str | None], bytes] = {}
+
+
+def get_request_prefix(operation_name: str, query: str | None = None, query_hash: str | None = None) -> bytes:
+    key = (operation_name, query, query_hash)
+    prefix = _request_prefixes.get(key)
+
+    if prefix is None:
+        parts = [b'{"operationName":', dumps(operation_name)]
+
+        if query is not None:
+            parts += [b',"query":', dumps(query)]
+
+        if query_hash is not None:
+            parts += [b',"extensions":', dumps({'persistedQuery': {'version': 1, 'sha256Hash': query_hash}})]
+
+        parts.append(b',"variables":')
+
+        prefix = b''.join(parts)
+        _request_prefixes[key] = prefix
+
+    return prefix
+
+
+def encode_request(operation_name: str,
+                   variables: dict[str, Any] | None = None,
+                   query: str | None = None,
+                   query_hash: str | None = None) -> bytes:
+    return b''.join([get_request_prefix(operation_name=operation_name, query=query, query_hash=query_hash),
+                     dumps(variables or {}),
+                     b'}'])
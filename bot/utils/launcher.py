@@ -1,15 +1,28 @@
 import os
-import glob
 import asyncio
 import argparse
-from itertools import cycle
+from math import ceil
+from contextlib import suppress
+from typing import Iterable, Iterator
 
 from pyrogram import Client
 from better_proxy import Proxy
 
 from bot.config import settings
 from bot.utils import logger
-from bot.core.tapper import run_tapper
+from bot.utils.stats import stats, log_taps_summary
+from bot.utils.logger import redirect_to_queue
+from bot.utils.event_loop import install_event_loop
+from bot.utils.session_store import session_store
+from bot.core.tapper import Tapper
+from bot.core.scheduler import Scheduler
+from bot.core.transport import close_http_clients, set_limiter_shares
+from bot.core.client_pool import client_pool
+from bot.core.refresh import refresh_coordinator
+from bot.core.proxy_pool import ProxyPool
+from bot.core.metrics_server import MetricsServer
+from bot.core.profiler import profiler
+from bot.core.supervisor import Supervisor, get_shard, report_stats
 from bot.core.registrator import register_sessions
 
 
@@ -26,11 +39,26 @@ Select an action:
 """
 
 
-def get_session_names() -> list[str]:
-    session_names = glob.glob('sessions/*.session')
-    session_names = [os.path.splitext(os.path.basename(file))[0] for file in session_names]
+def iter_session_names(shard_index: int = 0, shards_count: int = 1) -> Iterator[str]:
+    if not os.path.isdir('sessions/'):
+        return
 
-    return session_names
+    invalid_sessions = session_store.get_invalid_sessions()
+
+    with os.scandir('sessions/') as entries:
+        for entry in entries:
+            session_name, extension = os.path.splitext(entry.name)
+
+            if extension != '.session' or not entry.is_file():
+                continue
+
+            if session_name in invalid_sessions and entry.stat().st_mtime < invalid_sessions[session_name]:
+                continue
+
+            if shards_count > 1 and get_shard(key=session_name, shards_count=shards_count) != shard_index:
+                continue
+
+            yield session_name
 
 
 def get_proxies() -> list[Proxy]:
@@ -43,33 +71,33 @@ def get_proxies() -> list[Proxy]:
     return proxies
 
 
-async def get_tg_clients() -> list[Client]:
-    session_names = get_session_names()
-
-    if not session_names:
-        raise FileNotFoundError("Not found session files")
-
+def iter_tg_clients(shard_index: int = 0, shards_count: int = 1) -> Iterator[Client]:
     if not settings.API_ID or not settings.API_HASH:
         raise ValueError("API_ID and API_HASH not found in the .env file.")
 
-    tg_clients = [Client(
-        name=session_name,
-        api_id=settings.API_ID,
-        api_hash=settings.API_HASH,
-        workdir='sessions/',
-        plugins=dict(root='bot/plugins')
-    ) for session_name in session_names]
-
-    return tg_clients
+    for session_name in iter_session_names(shard_index=shard_index, shards_count=shards_count):
+        yield Client(
+            name=session_name,
+            api_id=settings.API_ID,
+            api_hash=settings.API_HASH,
+            workdir='sessions/',
+            no_updates=True
+        )
 
 
 async def process() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument('-a', '--action', type=int, help='Action to perform')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='Number of worker processes')
+    parser.add_argument('-p', '--profile', type=int, default=0, help='Profile the first N seconds of the run')
 
-    logger.info(f"Detected {len(get_session_names())} sessions | {len(get_proxies())} proxies")
+    proxies = get_proxies()
+    sessions_count = sum(1 for _ in iter_session_names())
+
+    logger.info(f"Detected {sessions_count} sessions | {len(proxies)} proxies")
 
-    action = parser.parse_args().action
+    args = parser.parse_args()
+    action = args.action
 
     if not action:
         print(start_text)
@@ -88,15 +116,82 @@ async def process() -> None:
     if action == 1:
         await register_sessions()
     elif action == 2:
-        tg_clients = await get_tg_clients()
+        if not sessions_count:
+            raise FileNotFoundError("Not found session files")
 
-        await run_tasks(tg_clients=tg_clients)
+        if args.workers > 1:
+            await Supervisor(target=run_shard, workers=args.workers, proxies=proxies,
+                             profile_duration=args.profile).run()
+        else:
+            await run_tasks(tg_clients=iter_tg_clients(), proxies=proxies, profile_duration=args.profile)
 
 
-async def run_tasks(tg_clients: list[Client]):
-    proxies = get_proxies()
-    proxies_cycle = cycle(proxies) if proxies else None
-    tasks = [asyncio.create_task(run_tapper(tg_client=tg_client, proxy=next(proxies_cycle) if proxies_cycle else None))
-             for tg_client in tg_clients]
+async def run_tasks(tg_clients: Iterable[Client], proxies: list[str], metrics_port: int = settings.METRICS_PORT,
+                    profile_duration: int = 0):
+    proxy_pool = ProxyPool(proxies=proxies, check_interval=settings.PROXY_CHECK_INTERVAL) if proxies else None
+    proxy_checker = None
+    taps_summary = None
+
+    metrics_server = MetricsServer(host=settings.METRICS_HOST, port=metrics_port) if metrics_port else None
+
+    scheduler = Scheduler(workers=settings.SCHEDULER_WORKERS)
+
+    tappers = (Tapper(tg_client=tg_client, proxy_pool=proxy_pool) for tg_client in tg_clients)
+
+    profiler.install_signal_handler(duration=settings.PROFILE_DURATION)
+
+    if profile_duration:
+        profiler.start(duration=profile_duration)
+
+    try:
+        if settings.LOG_TAPS_SUMMARY_INTERVAL:
+            taps_summary = asyncio.create_task(log_taps_summary(interval=settings.LOG_TAPS_SUMMARY_INTERVAL))
+
+        if metrics_server:
+            await metrics_server.start()
+
+        if proxy_pool:
+            await proxy_pool.probe_all()
+            proxy_checker = asyncio.create_task(proxy_pool.run())
+
+        await scheduler.run(tappers=tappers, ramp_up_rate=settings.SESSIONS_RAMP_UP_RATE)
+    finally:
+        if proxy_checker:
+            proxy_checker.cancel()
+
+        if taps_summary:
+            taps_summary.cancel()
+
+        if metrics_server:
+            await metrics_server.stop()
+
+        await close_http_clients()
+        await client_pool.close()
+
+
+async def run_shard_tasks(shard_index: int, shards_count: int, proxies: list[str], proxy_shares: int,
+                          profile_duration: int, queue) -> None:
+    set_limiter_shares(shares=proxy_shares)
+    refresh_coordinator.configure(concurrency=ceil(settings.TG_REFRESH_CONCURRENCY / shards_count),
+                                  rate=settings.TG_REFRESH_RATE / shards_count)
+
+    reporter = asyncio.create_task(report_stats(queue=queue, shard_index=shard_index))
+
+    try:
+        await run_tasks(tg_clients=iter_tg_clients(shard_index=shard_index, shards_count=shards_count),
+                        proxies=proxies,
+                        metrics_port=settings.METRICS_PORT + shard_index if settings.METRICS_PORT else 0,
+                        profile_duration=profile_duration)
+    finally:
+        reporter.cancel()
+        queue.put(('stats', shard_index, stats.snapshot()))
+
+
+def run_shard(shard_index: int, shards_count: int, proxies: list[str], proxy_shares: int, profile_duration: int,
+              queue, colorize: bool) -> None:
+    redirect_to_queue(queue=queue, colorize=colorize)
+    install_event_loop(backend=settings.EVENT_LOOP)
 
-    await asyncio.gather(*tasks)
+    with suppress(KeyboardInterrupt):
+        asyncio.run(run_shard_tasks(shard_index=shard_index, shards_count=shards_count, proxies=proxies,
+                                    proxy_shares=proxy_shares, profile_duration=profile_duration, queue=queue))
@@ -1,10 +1,133 @@
 import sys
+import atexit
+from queue import Queue, Empty, Full
+from contextlib import suppress
+from threading import Thread
+from typing import Callable
+
 from loguru import logger
 
+from bot.config import settings
+from bot.utils.json_codec import dumps
+
+
+LOG_FORMAT = ("<white>{time:YYYY-MM-DD HH:mm:ss}</white>"
+              " | <level>{level: <8}</level>"
+              " | <cyan><b>{line}</b></cyan>"
+              " - <white><b>{message}</b></white>")
+
+BATCH_SIZE = 512
+QUEUE_SIZE = 10_000
+
+
+def report_error(text: str) -> None:
+    with suppress(Exception):
+        sys.stderr.write(f'Log writer: {text}\n')
+        sys.stderr.flush()
+
+
+class BatchedSink:
+    def __init__(self, write: Callable[[str], None], serialize: bool = False):
+        self.writer = write
+        self.serialize = serialize
+
+        self.queue = Queue(maxsize=QUEUE_SIZE)
+        self.dropped = 0
+        self.thread = Thread(target=self.run, name='log-writer', daemon=True)
+        self.thread.start()
+
+    def __call__(self, message) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except Full:
+            self.dropped += 1
+
+    def format(self, message) -> str:
+        if not self.serialize:
+            return str(message)
+
+        record = message.record
+
+        return dumps({
+            'time': record['time'].isoformat(),
+            'level': record['level'].name,
+            'module': record['module'],
+            'line': record['line'],
+            'message': record['message'],
+            **record['extra'],
+        }).decode() + '\n'
+
+    def format_batch(self, messages: list) -> str:
+        lines = []
+
+        for message in messages:
+            if message is None:
+                continue
+
+            try:
+                lines.append(self.format(message))
+            except Exception as error:
+                report_error(f'failed to format a message: {error!r}')
+
+        return ''.join(lines)
+
+    def run(self) -> None:
+        while True:
+            messages = [self.queue.get()]
+
+            while len(messages) < BATCH_SIZE:
+                try:
+                    messages.append(self.queue.get_nowait())
+                except Empty:
+                    break
+
+            try:
+                self.writer(self.format_batch(messages=messages))
+            except Exception as error:
+                report_error(f'failed to write {len(messages)} messages: {error!r}')
+
+            if self.dropped:
+                dropped, self.dropped = self.dropped, 0
+                report_error(f'dropped {dropped} messages, the queue is full')
+
+            if None in messages:
+                return
+
+    def stop(self) -> None:
+        if self.thread.is_alive():
+            with suppress(Full):
+                self.queue.put(None, timeout=5)
+
+            self.thread.join(timeout=5)
+
+
+def write_stdout(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def configure_sink(write: Callable[[str], None], colorize: bool) -> None:
+    global _sink
+
+    logger.remove()
+
+    if _sink is not None:
+        _sink.stop()
+
+    _sink = BatchedSink(write=write, serialize=settings.LOG_JSON)
+    logger.add(sink=_sink,
+               level=settings.LOG_LEVEL,
+               format='{message}' if settings.LOG_JSON else LOG_FORMAT,
+               colorize=colorize and not settings.LOG_JSON)
+
+
+def redirect_to_queue(queue, colorize: bool) -> None:
+    configure_sink(write=lambda text: queue.put(('log', text)), colorize=colorize)
+
+
+_sink: BatchedSink | None = None
+
+configure_sink(write=write_stdout, colorize=sys.stdout.isatty())
+atexit.register(lambda: _sink.stop())
 
-logger.remove()
-logger.add(sink=sys.stdout, format="<white>{time:YYYY-MM-DD HH:mm:ss}</white>"
-                                   " | <level>{level: <8}</level>"
-                                   " | <cyan><b>{line}</b></cyan>"
-                                   " - <white><b>{message}</b></white>")
 logger = logger.opt(colors=True)
@@ -0,0 +1,150 @@
+from bisect import bisect_left
+
+
+DEFAULT_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30)
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ''
+
+    labels = ','.join(f'{name}="{escape_label(value)}"' for name, value in zip(names, values))
+
+    return f'{{{labels}}}'
+
+
+def escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metric:
+    type_ = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+
+    def render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        return '\n'.join([f'# HELP {self.name} {self.documentation}',
+                          f'# TYPE {self.name} {self.type_}',
+                          *self.render_samples()])
+
+
+class Counter(Metric):
+    type_ = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name=name, documentation=documentation, labels=labels)
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, value: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + value
+
+    def render_samples(self) -> list[str]:
+        return [f'{self.name}{format_labels(self.labels, labels)} {value}' for labels, value in self.values.items()]
+
+
+class Gauge(Counter):
+    type_ = 'gauge'
+
+    def set(self, *labels: str, value: float) -> None:
+        self.values[labels] = value
+
+    def remove(self, *labels: str) -> None:
+        self.values.pop(labels, None)
+
+
+class Histogram(Metric):
+    type_ = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name=name, documentation=documentation, labels=labels)
+        self.buckets = buckets
+        self.values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, *labels: str, value: float) -> None:
+        counts = self.values.get(labels)
+
+        if counts is None:
+            counts = self.values[labels] = [0] * (len(self.buckets) + 2)
+
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render_samples(self) -> list[str]:
+        samples = []
+
+        for labels, counts in self.values.items():
+            label_names = (*self.labels, 'le')
+            total = 0
+
+            for bucket, count in zip((*self.buckets, '+Inf'), counts):
+                total += count
+                samples.append(f'{self.name}_bucket{format_labels(label_names, (*labels, bucket))} {total}')
+
+            samples.append(f'{self.name}_sum{format_labels(self.labels, labels)} {counts[-1]}')
+            samples.append(f'{self.name}_count{format_labels(self.labels, labels)} {total}')
+
+        return samples
+
+
+class Distribution(Histogram):
+    def __init__(self, name: str, documentation: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name=name, documentation=documentation, buckets=buckets)
+        self.current: dict[str, float] = {}
+
+    def set(self, key: str, value: float) -> None:
+        self.current[key] = value
+
+    def remove(self, key: str) -> None:
+        self.current.pop(key, None)
+
+    def render_samples(self) -> list[str]:
+        self.values.clear()
+
+        for value in self.current.values():
+            self.observe(value=value)
+
+        return super().render_samples()
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+
+        return metric
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self.metrics) + '\n'
+
+
+registry = Registry()
+
+graphql_latency = registry.register(Histogram('memefi_graphql_request_duration_seconds',
+                                              'GraphQL request latency', labels=('operation',)))
+graphql_requests = registry.register(Counter('memefi_graphql_requests_total',
+                                             'GraphQL requests sent', labels=('operation',)))
+graphql_retries = registry.register(Counter('memefi_graphql_retries_total',
+                                            'GraphQL request retries', labels=('operation',)))
+graphql_errors = registry.register(Counter('memefi_graphql_errors_total',
+                                           'GraphQL request errors', labels=('operation', 'type')))
+taps_sent = registry.register(Counter('memefi_taps_total', 'Taps sent'))
+coins_earned = registry.register(Counter('memefi_coins_earned_total', 'Coins earned by taps'))
+accounts_energy = registry.register(Distribution('memefi_accounts_energy', 'Current energy of accounts',
+                                                  buckets=(100, 250, 500, 1000, 2500, 5000, 10000, 25000)))
+accounts_boss_level = registry.register(Distribution('memefi_accounts_boss_level', 'Current boss level of accounts',
+                                                     buckets=(1, 2, 3, 5, 7, 10, 15, 20, 30, 50)))
+account_energy = registry.register(Gauge('memefi_account_energy', 'Current account energy', labels=('session',)))
+boss_level = registry.register(Gauge('memefi_boss_level', 'Current boss level', labels=('session',)))
+proxy_in_flight = registry.register(Gauge('memefi_proxy_in_flight_requests',
+                                          'Requests in flight per proxy', labels=('proxy',)))
+event_loop_lag = registry.register(Histogram('memefi_event_loop_lag_seconds', 'Event loop lag',
+                                             buckets=(.001, .005, .01, .05, .1, .5, 1, 5)))
@@ -0,0 +1,122 @@
+from datetime import datetime
+from dataclasses import dataclass
+from typing import Any
+
+from bot.exceptions import InvalidProtocol
+
+
+def get_field(data: dict[str, Any], key: str, type_: type | tuple[type, ...], model: str,
+              nullable: bool = False) -> Any:
+    try:
+        value = data[key]
+    except (KeyError, TypeError):
+        raise InvalidProtocol(f'{model} msg: missing field "{key}"')
+
+    if value is None and nullable:
+        return None
+
+    if not isinstance(value, type_) or (isinstance(value, bool) and type_ is not bool):
+        raise InvalidProtocol(f'{model} msg: invalid field "{key}": {value!r}')
+
+    return value
+
+
+@dataclass(slots=True)
+class Boss:
+    level: int
+    current_health: int
+    max_health: int
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'Boss':
+        return cls(
+            level=get_field(data, 'level', int, 'Boss'),
+            current_health=get_field(data, 'currentHealth', int, 'Boss'),
+            max_health=get_field(data, 'maxHealth', int, 'Boss'),
+        )
+
+
+@dataclass(slots=True)
+class FreeBoosts:
+    current_turbo_amount: int
+    current_refill_energy_amount: int
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'FreeBoosts':
+        return cls(
+            current_turbo_amount=get_field(data, 'currentTurboAmount', int, 'FreeBoosts'),
+            current_refill_energy_amount=get_field(data, 'currentRefillEnergyAmount', int, 'FreeBoosts'),
+        )
+
+
+@dataclass(slots=True)
+class GameConfig:
+    coins_amount: int
+    current_energy: int
+    max_energy: int
+    weapon_level: int
+    zones_count: int
+    energy_limit_level: int
+    energy_recharge_level: int
+    nonce: str
+    spin_energy_total: int
+    current_boss: Boss
+    free_boosts: FreeBoosts
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'GameConfig':
+        return cls(
+            coins_amount=get_field(data, 'coinsAmount', int, 'GameConfig'),
+            current_energy=get_field(data, 'currentEnergy', int, 'GameConfig'),
+            max_energy=get_field(data, 'maxEnergy', int, 'GameConfig'),
+            weapon_level=get_field(data, 'weaponLevel', int, 'GameConfig'),
+            zones_count=get_field(data, 'zonesCount', int, 'GameConfig'),
+            energy_limit_level=get_field(data, 'energyLimitLevel', int, 'GameConfig'),
+            energy_recharge_level=get_field(data, 'energyRechargeLevel', int, 'GameConfig'),
+            nonce=get_field(data, 'nonce', str, 'GameConfig'),
+            spin_energy_total=get_field(data, 'spinEnergyTotal', int, 'GameConfig', nullable=True) or 0,
+            current_boss=Boss.from_dict(get_field(data, 'currentBoss', dict, 'GameConfig')),
+            free_boosts=FreeBoosts.from_dict(get_field(data, 'freeBoosts', dict, 'GameConfig')),
+        )
+
+
+@dataclass(slots=True)
+class TapbotConfig:
+    damage_per_sec: int | float
+    is_purchased: bool
+    starts_at: str | None
+    ends_at: str | None
+    total_attempts: int
+    used_attempts: int
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'TapbotConfig':
+        return cls(
+            damage_per_sec=get_field(data, 'damagePerSec', (int, float), 'TapbotConfig', nullable=True) or 0,
+            is_purchased=get_field(data, 'isPurchased', bool, 'TapbotConfig'),
+            starts_at=get_field(data, 'startsAt', str, 'TapbotConfig', nullable=True),
+            ends_at=get_field(data, 'endsAt', str, 'TapbotConfig', nullable=True),
+            total_attempts=get_field(data, 'totalAttempts', int, 'TapbotConfig'),
+            used_attempts=get_field(data, 'usedAttempts', int, 'TapbotConfig'),
+        )
+
+    @property
+    def ends_at_date(self) -> datetime | None:
+        return datetime.strptime(self.ends_at, '%Y-%m-%dT%H:%M:%S.%f%z') if self.ends_at else None
+
+
+@dataclass(slots=True)
+class SlotMachineSpin:
+    game_config: GameConfig
+    reward_amount: int
+    reward_type: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'SlotMachineSpin':
+        spin_results = get_field(data, 'spinResults', list, 'SlotMachineSpin') or [{}]
+
+        return cls(
+            game_config=GameConfig.from_dict(get_field(data, 'gameConfig', dict, 'SlotMachineSpin')),
+            reward_amount=spin_results[0].get('rewardAmount') or 0,
+            reward_type=spin_results[0].get('rewardType') or 'NO',
+        )
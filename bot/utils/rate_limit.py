@@ -0,0 +1,18 @@
+from time import monotonic
+
+
+class TokenBucket:
+    __slots__ = ('interval', 'burst', 'theoretical_at')
+
+    def __init__(self, rate: float, burst: int):
+        self.interval = 1 / rate if rate > 0 else 0.
+        self.burst = max(burst, 1)
+        self.theoretical_at = 0.
+
+    def reserve(self) -> float:
+        now = monotonic()
+        theoretical_at = max(self.theoretical_at, now)
+
+        self.theoretical_at = theoretical_at + self.interval
+
+        return max(theoretical_at - now - (self.burst - 1) * self.interval, 0.)
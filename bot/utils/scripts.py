@@ -1,4 +1,5 @@
 import bisect
+from random import choices, randbytes
 
 
 def calculate_spin_multiplier(spins):
@@ -6,3 +7,38 @@ def calculate_spin_multiplier(spins):
     idx = bisect.bisect_right(variables, spins) - 1
 
     return variables[idx] if idx >= 0 else 1
+
+
+_zone_tables: dict[int, tuple[bytes, bytes]] = {}
+
+
+def get_zone_table(zones: int) -> tuple[bytes, bytes]:
+    zone_table = _zone_tables.get(zones)
+
+    if zone_table is None:
+        limit = 256 - 256 % zones
+        table = bytes(ord('1') + byte % zones if byte < limit else 0 for byte in range(256))
+        zone_table = _zone_tables[zones] = (table, bytes(range(limit, 256)))
+
+    return zone_table
+
+
+def generate_tap_vector(taps: int, zones: int = 4) -> str:
+    if taps <= 0:
+        return ''
+
+    zones = max(zones, 1)
+
+    if zones > 9:
+        return ','.join(map(str, choices(range(1, zones + 1), k=taps)))
+
+    table, delete = get_zone_table(zones=zones)
+
+    digits = randbytes(taps).translate(table, delete)
+    while len(digits) < taps:
+        digits += randbytes(taps - len(digits) + 16).translate(table, delete)
+
+    vector = bytearray(b',') * (2 * taps - 1)
+    vector[::2] = digits[:taps]
+
+    return vector.decode('ascii')
@@ -0,0 +1,125 @@
+import os
+import sqlite3
+from time import time
+from base64 import urlsafe_b64decode
+
+from bot.utils.json_codec import dumps, loads
+
+
+def get_token_expiry(access_token: str) -> float | None:
+    try:
+        payload = access_token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+
+        return float(loads(urlsafe_b64decode(payload))['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class SessionStore:
+    def __init__(self, path: str = 'sessions/store.sqlite3'):
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+
+        self._peers: dict[tuple[str, str], tuple[int, int]] = {}
+        self._profiles: dict[str, dict] = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+
+            self._connection = sqlite3.connect(self.path, isolation_level=None, timeout=30)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS tokens ('
+                                     'session_name TEXT PRIMARY KEY, '
+                                     'access_token TEXT NOT NULL, '
+                                     'expires_at REAL NOT NULL)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS peers ('
+                                     'session_name TEXT NOT NULL, '
+                                     'username TEXT NOT NULL, '
+                                     'user_id INTEGER NOT NULL, '
+                                     'access_hash INTEGER NOT NULL, '
+                                     'PRIMARY KEY (session_name, username))')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS profiles ('
+                                     'session_name TEXT PRIMARY KEY, '
+                                     'profile TEXT NOT NULL)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS invalid_sessions ('
+                                     'session_name TEXT PRIMARY KEY, '
+                                     'invalid_at REAL NOT NULL)')
+
+        return self._connection
+
+    def get_access_token(self, session_name: str) -> tuple[str, float] | None:
+        row = self.connection.execute('SELECT access_token, expires_at FROM tokens WHERE session_name = ?',
+                                      (session_name,)).fetchone()
+
+        if row is None or row[1] <= time():
+            return None
+
+        return row[0], row[1]
+
+    def set_access_token(self, session_name: str, access_token: str, expires_at: float) -> None:
+        self.connection.execute('INSERT OR REPLACE INTO tokens (session_name, access_token, expires_at) '
+                                'VALUES (?, ?, ?)', (session_name, access_token, expires_at))
+
+    def delete_access_token(self, session_name: str) -> None:
+        self.connection.execute('DELETE FROM tokens WHERE session_name = ?', (session_name,))
+
+    def get_peer(self, session_name: str, username: str) -> tuple[int, int] | None:
+        key = (session_name, username)
+
+        if key not in self._peers:
+            row = self.connection.execute('SELECT user_id, access_hash FROM peers '
+                                          'WHERE session_name = ? AND username = ?', key).fetchone()
+            if row is None:
+                return None
+
+            self._peers[key] = row[0], row[1]
+
+        return self._peers[key]
+
+    def set_peer(self, session_name: str, username: str, user_id: int, access_hash: int) -> None:
+        self._peers[(session_name, username)] = user_id, access_hash
+        self.connection.execute('INSERT OR REPLACE INTO peers (session_name, username, user_id, access_hash) '
+                                'VALUES (?, ?, ?, ?)', (session_name, username, user_id, access_hash))
+
+    def delete_peer(self, session_name: str, username: str) -> None:
+        self._peers.pop((session_name, username), None)
+        self.connection.execute('DELETE FROM peers WHERE session_name = ? AND username = ?',
+                                (session_name, username))
+
+    def get_profile(self, session_name: str) -> dict | None:
+        if session_name not in self._profiles:
+            row = self.connection.execute('SELECT profile FROM profiles WHERE session_name = ?',
+                                          (session_name,)).fetchone()
+            if row is None:
+                return None
+
+            self._profiles[session_name] = loads(row[0])
+
+        return self._profiles[session_name]
+
+    def set_profile(self, session_name: str, profile: dict) -> None:
+        self._profiles[session_name] = profile
+        self.connection.execute('INSERT OR REPLACE INTO profiles (session_name, profile) VALUES (?, ?)',
+                                (session_name, dumps(profile).decode()))
+
+    def delete_profile(self, session_name: str) -> None:
+        self._profiles.pop(session_name, None)
+        self.connection.execute('DELETE FROM profiles WHERE session_name = ?', (session_name,))
+
+    def get_invalid_sessions(self) -> dict[str, float]:
+        return dict(self.connection.execute('SELECT session_name, invalid_at FROM invalid_sessions'))
+
+    def set_session_invalid(self, session_name: str) -> None:
+        self.connection.execute('INSERT OR REPLACE INTO invalid_sessions (session_name, invalid_at) VALUES (?, ?)',
+                                (session_name, time()))
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+session_store = SessionStore()
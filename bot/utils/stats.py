@@ -0,0 +1,39 @@
+import asyncio
+from collections import Counter
+
+from bot.utils import logger
+
+
+class Stats:
+    def __init__(self):
+        self.counters: Counter[str] = Counter()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        self.counters[name] += value
+
+    def snapshot(self) -> dict[str, int]:
+        return dict(self.counters)
+
+
+stats = Stats()
+
+
+def get_requests_per_1k_coins(requests: int, coins: int) -> float:
+    return requests / coins * 1000 if coins else 0.
+
+
+async def log_taps_summary(interval: int) -> None:
+    previous = stats.snapshot()
+
+    while True:
+        await asyncio.sleep(interval)
+
+        current = stats.snapshot()
+        taps = current.get('taps', 0) - previous.get('taps', 0)
+        coins = current.get('coins', 0) - previous.get('coins', 0)
+        requests = current.get('requests', 0) - previous.get('requests', 0)
+        previous = current
+
+        logger.success(f"Last {interval}s | Accounts: <lc>{current.get('accounts', 0):,}</lc> | "
+                       f"Taps: <lg>{taps:,}</lg> | Coins: <lg>+{coins:,}</lg> | "
+                       f"Requests per 1k coins: <lw>{get_requests_per_1k_coins(requests=requests, coins=coins):,.2f}</lw>")
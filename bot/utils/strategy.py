@@ -0,0 +1,71 @@
+from random import randint
+
+from bot.config.config import Settings
+from bot.utils.boosts import FreeBoostType
+from bot.utils.models import GameConfig
+from bot.utils.tap_planner import TapPlan, plan_taps
+
+
+TURBO_SLEEP = 4
+
+
+def choose_taps(energy: int, game_config: GameConfig, active_turbo: bool, config: Settings) -> TapPlan:
+    if config.ADAPTIVE_TAPS is True:
+        return plan_taps(energy=energy,
+                         weapon_level=game_config.weapon_level,
+                         boss_health=game_config.current_boss.current_health,
+                         min_taps=config.RANDOM_TAPS_COUNT[0],
+                         max_taps=config.MAX_TAPS_PER_BATCH,
+                         turbo_taps=config.RANDOM_TAPS_COUNT[1] + config.ADD_TAPS_ON_TURBO if active_turbo else 0)
+
+    taps = randint(a=config.RANDOM_TAPS_COUNT[0], b=config.RANDOM_TAPS_COUNT[1])
+
+    if active_turbo:
+        return TapPlan(taps=taps + config.ADD_TAPS_ON_TURBO, need_energy=0, batches=1)
+
+    return TapPlan(taps=taps, need_energy=taps * game_config.weapon_level, batches=1)
+
+
+def choose_free_boost(game_config: GameConfig, energy: int, config: Settings) -> FreeBoostType | None:
+    free_boosts = game_config.free_boosts
+
+    if (free_boosts.current_refill_energy_amount > 0
+            and energy < config.MIN_AVAILABLE_ENERGY
+            and config.APPLY_DAILY_ENERGY is True):
+        return FreeBoostType.ENERGY
+
+    if free_boosts.current_turbo_amount > 0 and config.APPLY_DAILY_TURBO is True:
+        return FreeBoostType.TURBO
+
+    return None
+
+
+def get_sleep_between_taps(active_turbo: bool, config: Settings) -> int:
+    if active_turbo is True:
+        return TURBO_SLEEP
+
+    return randint(a=config.SLEEP_BETWEEN_TAP[0], b=config.SLEEP_BETWEEN_TAP[1])
+
+
+def get_min_energy_sleep(energy: int, seconds_until_full: float, sleep_between_taps: int,
+                         config: Settings) -> float | None:
+    if energy >= config.MIN_AVAILABLE_ENERGY:
+        return None
+
+    if isinstance(config.SLEEP_BY_MIN_ENERGY, list):
+        sleep_time = randint(a=config.SLEEP_BY_MIN_ENERGY[0], b=config.SLEEP_BY_MIN_ENERGY[1])
+    else:
+        sleep_time = config.SLEEP_BY_MIN_ENERGY
+
+    return max(min(sleep_time, seconds_until_full), sleep_between_taps)
+
+
+def get_sleep_after_taps(sleep_between_taps: int, batches: int, active_turbo: bool,
+                         seconds_until_min_batch: float, config: Settings) -> float:
+    if batches > 1:
+        return config.SLEEP_BETWEEN_TAP[0]
+
+    if active_turbo is False:
+        return max(sleep_between_taps, min(seconds_until_min_batch, config.SLEEP_BETWEEN_TAP[1]))
+
+    return sleep_between_taps
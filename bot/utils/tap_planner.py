@@ -0,0 +1,30 @@
+from math import ceil
+from typing import NamedTuple
+
+
+class TapPlan(NamedTuple):
+    taps: int
+    need_energy: int
+    batches: int
+
+
+def plan_taps(energy: int, weapon_level: int, boss_health: int, min_taps: int, max_taps: int,
+              turbo_taps: int = 0) -> TapPlan:
+    energy_per_tap = max(weapon_level, 1)
+    boss_taps = max(ceil(boss_health / energy_per_tap), 1)
+
+    if turbo_taps:
+        taps = min(turbo_taps, boss_taps)
+        return TapPlan(taps=taps, need_energy=0, batches=1)
+
+    affordable_taps = energy // energy_per_tap
+    usable_taps = min(affordable_taps, boss_taps)
+
+    if usable_taps < min(min_taps, boss_taps):
+        taps = min(min_taps, boss_taps)
+        return TapPlan(taps=taps, need_energy=taps * energy_per_tap, batches=1)
+
+    batches = ceil(usable_taps / max_taps)
+    taps = ceil(usable_taps / batches)
+
+    return TapPlan(taps=taps, need_energy=taps * energy_per_tap, batches=batches)
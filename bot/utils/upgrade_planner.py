@@ -0,0 +1,91 @@
+from math import ceil
+from typing import Iterator, NamedTuple
+
+from bot.config.config import Settings
+from bot.utils.boosts import UpgradableBoostType
+from bot.utils.energy import get_recharge_rate
+from bot.utils.models import GameConfig, TapbotConfig
+from bot.utils.strategy import TURBO_SLEEP
+
+
+DAY = 24 * 3600
+FREE_BOOSTS_PER_DAY = 3
+TURBO_DURATION = 10
+ENERGY_PER_LIMIT_LEVEL = 500
+TAPBOT_PRICE = 200_000
+TAPBOT_DURATION = 3 * 3600
+
+
+class UpgradePlan(NamedTuple):
+    boost_type: UpgradableBoostType
+    level: int
+    price: int
+    daily_gain: float
+
+    @property
+    def payback_hours(self) -> float:
+        return self.price / self.daily_gain * 24
+
+
+def get_upgrade_price(level: int) -> int:
+    return 1000 * (2 ** (level - 1))
+
+
+def iter_upgrades(game_config: GameConfig, tapbot_config: TapbotConfig | None,
+                  config: Settings) -> Iterator[tuple[UpgradableBoostType, int, int]]:
+    upgrades = (
+        (UpgradableBoostType.TAP, config.AUTO_UPGRADE_TAP, game_config.weapon_level, config.MAX_TAP_LEVEL),
+        (UpgradableBoostType.ENERGY, config.AUTO_UPGRADE_ENERGY, game_config.energy_limit_level,
+         config.MAX_ENERGY_LEVEL),
+        (UpgradableBoostType.CHARGE, config.AUTO_UPGRADE_CHARGE, game_config.energy_recharge_level,
+         config.MAX_CHARGE_LEVEL),
+    )
+
+    for boost_type, enabled, level, max_level in upgrades:
+        if enabled is True and level + 1 <= max_level:
+            yield boost_type, level + 1, get_upgrade_price(level=level + 1)
+
+    if config.USE_TAP_BOT is True and tapbot_config is not None and not tapbot_config.is_purchased:
+        yield UpgradableBoostType.TAPBOT, 1, TAPBOT_PRICE
+
+
+def get_daily_gain(boost_type: UpgradableBoostType, game_config: GameConfig, tapbot_config: TapbotConfig | None,
+                   config: Settings) -> float:
+    if boost_type == UpgradableBoostType.TAP:
+        if config.APPLY_DAILY_TURBO is not True:
+            return 0.
+
+        turbo_taps = config.RANDOM_TAPS_COUNT[1] + config.ADD_TAPS_ON_TURBO
+
+        return FREE_BOOSTS_PER_DAY * ceil(TURBO_DURATION / TURBO_SLEEP) * turbo_taps
+
+    if boost_type == UpgradableBoostType.ENERGY:
+        return FREE_BOOSTS_PER_DAY * ENERGY_PER_LIMIT_LEVEL if config.APPLY_DAILY_ENERGY is True else 0.
+
+    if boost_type == UpgradableBoostType.CHARGE:
+        level = game_config.energy_recharge_level
+
+        return (get_recharge_rate(recharge_level=level + 1) - get_recharge_rate(recharge_level=level)) * DAY
+
+    damage_per_sec = (tapbot_config.damage_per_sec if tapbot_config else 0) or game_config.weapon_level
+    attempts = tapbot_config.total_attempts if tapbot_config else 1
+
+    return damage_per_sec * TAPBOT_DURATION * attempts
+
+
+def plan_upgrade(game_config: GameConfig, tapbot_config: TapbotConfig | None,
+                 config: Settings) -> UpgradePlan | None:
+    best_plan = None
+
+    for boost_type, level, price in iter_upgrades(game_config=game_config, tapbot_config=tapbot_config,
+                                                  config=config):
+        daily_gain = get_daily_gain(boost_type=boost_type, game_config=game_config, tapbot_config=tapbot_config,
+                                    config=config)
+
+        if daily_gain <= 0:
+            continue
+
+        if best_plan is None or daily_gain / price > best_plan.daily_gain / best_plan.price:
+            best_plan = UpgradePlan(boost_type=boost_type, level=level, price=price, daily_gain=daily_gain)
+
+    return best_plan
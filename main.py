@@ -1,7 +1,9 @@
 import asyncio
 from contextlib import suppress
 
+from bot.config import settings
 from bot.utils.launcher import process
+from bot.utils.event_loop import install_event_loop
 
 
 async def main():
@@ -9,5 +11,7 @@ async def main():
 
 
 if __name__ == '__main__':
+    install_event_loop(backend=settings.EVENT_LOOP)
+
     with suppress(KeyboardInterrupt):
         asyncio.run(main())